@@ -18,40 +18,169 @@ Usage:
 """
 
 import argparse
+import importlib.util
 import json
 import os
 import re
+import shlex
 import subprocess
 import sys
 import time
-import asyncio
-import socket
 import sqlite3
-import uuid
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from urllib.parse import urlparse
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+from urllib.parse import unquote, urlparse
+
+# Optional dependencies for enhanced UX; rich is only imported by `mcl ls`
+HAS_RICH = importlib.util.find_spec("rich") is not None
 
-# Optional dependencies for enhanced UX
 try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.text import Text
-    from rich import box
+    import orjson
 
-    HAS_RICH = True
+    HAS_ORJSON = True
 except ImportError:
-    HAS_RICH = False
+    HAS_ORJSON = False
+
+# orjson parses bytes directly; the stdlib accepts UTF-8 bytes as well
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+
+def _json_dumps(obj):
+    """Serialize obj as compact JSON for storage."""
+    return json.dumps(obj, separators=(",", ":"))
+
+
+# Patterns used on the task setup path, compiled once at import
+_ISSUE_URL_RE = re.compile(r"https://github\.com/([\w\-\.]+)/([\w\-\.]+)/issues/(\d+)")
+_NONALNUM_RE = re.compile(r"[^a-zA-Z0-9\s]")
+_NONWORD_RE = re.compile(r"[^\w\s]")
+# Bytes deleted by bytes.translate to match _NONWORD_RE on pure-ASCII text
+_NONWORD_ASCII_BYTES = bytes(
+    c for c in range(128) if not (chr(c).isalnum() or chr(c) == "_" or chr(c).isspace())
+)
+_SUMMARY_PREFIX_RE = re.compile(
+    r"^(?:add|implement|create|build|fix|update|modify|refactor) "
+)
+
+# Per-user state directory, resolved once at import
+_MCL_HOME = Path.home() / ".mcl"
+_DEFAULT_STAGING = _MCL_HOME / "staging"
+# In-progress background clones live in the staging directory under this prefix
+_CLONE_TMP_PREFIX = ".mcl-clone-"
+
+# Copy-on-write file cloning (Linux FICLONE ioctl / macOS clonefile), tried
+# once per process and disabled on the first failure
+_FICLONE = 0x40049409
+_reflink_supported = sys.platform.startswith("linux") or sys.platform == "darwin"
+
+# A fetch younger than this is reused instead of hitting the remote again
+_FETCH_MAX_AGE = 300
+
+# Directories left out when copying a source tree; venvs only at the top level
+_VENV_DIRS = frozenset(["venv", "env", ".venv"])
+_CACHE_DIRS = frozenset(
+    [
+        "__pycache__",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".tox",
+        ".nox",
+        "node_modules",
+    ]
+)
+
+# Fetched issues are reused without revalidation for this many seconds
+_ISSUE_CACHE_TTL = 600
+
+# GitHub API credentials and connection are set up once per process
+_GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+_GITHUB_API_HOST = "api.github.com"
+_github_conn = None
+
+
+def _github_connection():
+    """Return the shared keep-alive HTTPS connection to the GitHub API."""
+    global _github_conn
+    if _github_conn is None:
+        import http.client
+        import urllib.request
+
+        # Same proxy decision as urllib's ProxyHandler, including NO_PROXY
+        proxy = urllib.request.getproxies().get("https")
+        if proxy and not urllib.request.proxy_bypass(_GITHUB_API_HOST):
+            parsed = urlparse(proxy if "://" in proxy else f"http://{proxy}")
+            tunnel_headers = {}
+            if parsed.username and parsed.password:
+                import base64
+
+                credentials = f"{unquote(parsed.username)}:{unquote(parsed.password)}"
+                tunnel_headers["Proxy-Authorization"] = (
+                    "Basic " + base64.b64encode(credentials.encode()).decode("ascii")
+                )
+            # Like urllib, a proxy without a port gets HTTPSConnection's default
+            hostport = unquote(parsed.netloc.rpartition("@")[2])
+            _github_conn = http.client.HTTPSConnection(hostport, timeout=30)
+            _github_conn.set_tunnel(_GITHUB_API_HOST, headers=tunnel_headers)
+        else:
+            _github_conn = http.client.HTTPSConnection(_GITHUB_API_HOST, timeout=30)
+    return _github_conn
 
 
-def run_command(cmd, cwd=None, capture_output=True):
-    """Run a shell command and return the result."""
+def _github_send(path, headers):
+    """Send one GET over the shared connection and return (status, headers, body)."""
+    global _github_conn
+    headers = {"Accept-Encoding": "gzip", **headers}
+    for attempt in range(2):
+        conn = _github_connection()
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except ConnectionError:
+            # The server closed the idle keep-alive socket; reconnect once
+            conn.close()
+            _github_conn = None
+            if attempt:
+                raise
+            continue
+        except Exception:
+            conn.close()
+            _github_conn = None
+            raise
+        if response.getheader("Content-Encoding") == "gzip":
+            import gzip
+
+            body = gzip.decompress(body)
+        return response.status, response.headers, body
+
+
+def _github_get(path, headers, max_redirects=3):
+    """GET a GitHub API path, following redirects for renamed repositories."""
+    for _ in range(max_redirects + 1):
+        status, response_headers, body = _github_send(path, headers)
+        location = response_headers.get("Location")
+        if status not in (301, 302, 307, 308) or not location:
+            break
+        target = urlparse(location)
+        if target.netloc != _GITHUB_API_HOST:
+            break
+        path = f"{target.path}?{target.query}" if target.query else target.path
+    return status, response_headers, body
+
+
+def run_command(cmd, cwd=None, capture_output=True, quiet=False):
+    """Run a command (argument list or shell-style string) and return the result."""
+    # Strings are split here rather than handed to /bin/sh
+    if isinstance(cmd, str):
+        cmd = shlex.split(cmd)
     try:
         result = subprocess.run(
             cmd,
-            shell=True,
             cwd=cwd,
             capture_output=capture_output,
             text=True,
@@ -59,16 +188,24 @@ def run_command(cmd, cwd=None, capture_output=True):
         )
         return result.stdout.strip() if capture_output else None
     except subprocess.CalledProcessError as e:
-        print(f"Error running command '{cmd}': {e}")
-        if capture_output and e.stderr:
-            print(f"Error output: {e.stderr}")
+        # quiet is for probes where failure is an expected answer
+        if not quiet:
+            print(f"Error running command '{shlex.join(cmd)}': {e}")
+            if capture_output and e.stderr:
+                print(f"Error output: {e.stderr}")
+        return None
+    except OSError as e:
+        # A missing executable or cwd raises instead of returning a status
+        if not quiet:
+            print(f"Error running command '{shlex.join(cmd)}': {e}")
         return None
 
 
 def is_github_issue_url(text):
     """Check if the text is a GitHub issue URL."""
-    pattern = r"https://github\.com/[\w\-\.]+/[\w\-\.]+/issues/\d+"
-    return bool(re.match(pattern, text))
+    if not isinstance(text, str):
+        raise TypeError(f"expected str, got {type(text).__name__}")
+    return text.startswith("https://github.com/") and bool(_ISSUE_URL_RE.match(text))
 
 
 def is_requirements_file(text):
@@ -79,8 +216,7 @@ def is_requirements_file(text):
 def read_requirements_file(file_path):
     """Read requirements from a file."""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read().strip()
+        content = Path(file_path).read_text(encoding="utf-8").strip()
 
         if not content:
             print(f"Warning: Requirements file {file_path} is empty")
@@ -92,34 +228,87 @@ def read_requirements_file(file_path):
         return None
 
 
-def fetch_github_issue(issue_url):
+def _issue_cache_path(owner, repo, issue_number):
+    """Return the on-disk cache file for a GitHub issue."""
+    return _MCL_HOME / "cache" / "issues" / f"{owner}_{repo}_{issue_number}.json"
+
+
+def _read_issue_cache(cache_path):
+    """Load a cached issue entry and its age in seconds, or (None, None)."""
+    try:
+        with open(cache_path, "rb") as f:
+            age = time.time() - os.fstat(f.fileno()).st_mtime
+            return _json_loads(f.read()), age
+    except (OSError, ValueError):
+        return None, None
+
+
+def _write_issue_cache(cache_path, etag, last_modified, content):
+    """Atomically store formatted issue content with its HTTP validators."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"etag": etag, "last_modified": last_modified, "body": content}, f
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: could not cache GitHub issue: {e}")
+
+
+def fetch_github_issue(issue_url, refresh=False):
     """Fetch GitHub issue content using GitHub API."""
+    # http.client pulls in ssl; only pay for it here
+    import http.client
+
     # Parse URL to extract owner, repo, and issue number
-    pattern = r"https://github\.com/([\w\-\.]+)/([\w\-\.]+)/issues/(\d+)"
-    match = re.match(pattern, issue_url)
+    match = _ISSUE_URL_RE.match(issue_url)
 
     if not match:
         print(f"Invalid GitHub issue URL: {issue_url}")
         return None
 
     owner, repo, issue_number = match.groups()
-    api_url = f"https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}"
+    api_path = f"/repos/{owner}/{repo}/issues/{issue_number}"
+    cache_path = _issue_cache_path(owner, repo, issue_number)
+    cached, cache_age = (None, None) if refresh else _read_issue_cache(cache_path)
+
+    # Serve a recent copy without touching the network
+    if cached and cache_age < _ISSUE_CACHE_TTL:
+        return cached["body"]
 
     try:
         # Create request with authentication if GITHUB_TOKEN is available
-        headers = {}
-        github_token = os.getenv("GITHUB_TOKEN")
-        if github_token:
-            headers["Authorization"] = f"token {github_token}"
-            headers["User-Agent"] = "gh-task-setup-script"
-
-        request = Request(api_url, headers=headers)
-
-        with urlopen(request) as response:
-            if response.status != 200:
-                print(f"HTTP error {response.status} fetching issue")
-                return None
-            issue_data = json.loads(response.read().decode("utf-8"))
+        headers = {
+            "User-Agent": "gh-task-setup-script",
+            "Accept": "application/vnd.github+json",
+        }
+        if _GITHUB_TOKEN:
+            headers["Authorization"] = f"token {_GITHUB_TOKEN}"
+
+        # Revalidate any cached copy; a 304 doesn't count against the rate limit
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        status, response_headers, body = _github_get(api_path, headers)
+        if status == 304 and cached:
+            # Still current; restart the TTL
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return cached["body"]
+        if status != 200:
+            print(f"HTTP error {status} fetching issue")
+            return None
+
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        issue_data = _json_loads(body)
 
         title = issue_data.get("title", "")
         body = issue_data.get("body", "")
@@ -132,9 +321,10 @@ def fetch_github_issue(issue_url):
         formatted_content += f"**Issue URL:** {issue_url}\n\n"
         formatted_content += f"## Description\n\n{body}\n"
 
+        _write_issue_cache(cache_path, etag, last_modified, formatted_content)
         return formatted_content
 
-    except (URLError, HTTPError) as e:
+    except (OSError, http.client.HTTPException) as e:
         print(f"Error fetching GitHub issue: {e}")
         return None
     except Exception as e:
@@ -146,7 +336,7 @@ def is_local_path(repo_path):
     """Check if the repo argument is a local path rather than a URL."""
     # Handle relative and absolute paths
     abs_path = os.path.abspath(repo_path)
-    return os.path.exists(abs_path) and os.path.isdir(abs_path)
+    return os.path.isdir(abs_path)
 
 
 def is_git_url(repo_url):
@@ -157,38 +347,34 @@ def is_git_url(repo_url):
 def generate_feature_summary(requirements):
     """Generate a short feature summary from requirements for directory naming."""
     # Extract first line or first sentence
-    first_line = requirements.split("\n")[0].strip()
+    first_line = requirements.partition("\n")[0].strip()
     if not first_line:
         return "task"
 
     # Remove common prefixes and clean up
-    prefixes_to_remove = [
-        "add ",
-        "implement ",
-        "create ",
-        "build ",
-        "fix ",
-        "update ",
-        "modify ",
-        "refactor ",
-    ]
-    cleaned = first_line.lower()
-    for prefix in prefixes_to_remove:
-        if cleaned.startswith(prefix):
-            cleaned = cleaned[len(prefix) :]
-            break
+    cleaned = _SUMMARY_PREFIX_RE.sub("", first_line.lower(), count=1)
 
     # Extract key words (limit to 3-4 words)
-    words = re.sub(r"[^a-zA-Z0-9\s]", "", cleaned).split()[:4]
+    words = _NONALNUM_RE.sub("", cleaned).split()[:4]
     if not words:
         return "task"
 
     return "-".join(words)
 
 
-def get_repo_name(repo_input):
+def strip_punctuation(text):
+    """Remove everything except word characters and whitespace."""
+    # Unicode text still needs the regex to match \w and \s exactly
+    if text.isascii():
+        return text.encode("ascii").translate(None, _NONWORD_ASCII_BYTES).decode("ascii")
+    return _NONWORD_RE.sub("", text)
+
+
+def get_repo_name(repo_input, is_local=None):
     """Extract repository name from URL or local path."""
-    if is_local_path(repo_input):
+    if is_local is None:
+        is_local = is_local_path(repo_input)
+    if is_local:
         return os.path.basename(os.path.abspath(repo_input))
     else:
         parsed = urlparse(repo_input)
@@ -198,24 +384,30 @@ def get_repo_name(repo_input):
         return path.split("/")[-1]
 
 
-def get_feature_repo_name(repo_input, requirements):
+def get_feature_repo_name(repo_input, requirements, repo_name=None):
     """Get repository name with feature summary appended."""
-    base_name = get_repo_name(repo_input)
+    base_name = repo_name or get_repo_name(repo_input)
     feature_summary = generate_feature_summary(requirements)
     return f"{base_name}-{feature_summary}"
 
 
 def get_unique_repo_path(base_path):
     """Generate a unique repository path by appending a counter if needed."""
-    if not base_path.exists():
+    # One directory listing instead of a stat per candidate
+    try:
+        with os.scandir(base_path.parent) as it:
+            existing = {entry.name for entry in it}
+    except FileNotFoundError:
+        return base_path
+
+    name = base_path.name
+    if name not in existing:
         return base_path
 
     counter = 1
-    while True:
-        unique_path = Path(f"{base_path}-{counter}")
-        if not unique_path.exists():
-            return unique_path
+    while f"{name}-{counter}" in existing:
         counter += 1
+    return base_path.parent / f"{name}-{counter}"
 
 
 def is_git_repo(path):
@@ -224,6 +416,35 @@ def is_git_repo(path):
     return git_dir.exists()
 
 
+def recently_fetched(repo_path, max_age=_FETCH_MAX_AGE):
+    """Check if the repository was fetched within the last max_age seconds."""
+    try:
+        fetched_at = os.stat(Path(repo_path) / ".git" / "FETCH_HEAD").st_mtime
+    except OSError:
+        return False
+    return time.time() - fetched_at < max_age
+
+
+def current_branch(repo_path):
+    """Return the checked-out branch name, or "" for a detached HEAD."""
+    git_path = Path(repo_path) / ".git"
+    try:
+        # Worktrees have a .git file pointing at their private git directory
+        if git_path.is_file():
+            gitdir = git_path.read_text().strip()
+            if not gitdir.startswith("gitdir: "):
+                raise OSError(f"unrecognized .git file in {repo_path}")
+            git_path = Path(repo_path) / gitdir[8:]
+        head = (git_path / "HEAD").read_text().strip()
+    except OSError:
+        head = None
+    # Reftable repositories keep a placeholder HEAD; only git can read the real one
+    if head is not None and head != "ref: refs/heads/.invalid":
+        return head[16:] if head.startswith("ref: refs/heads/") else ""
+    result = run_command(["git", "branch", "--show-current"], cwd=repo_path)
+    return result.strip() if result else ""
+
+
 def setup_local_repo(source_path, dest_path, branch_name):
     """Set up local repository using git worktree if it's a git repo, otherwise copy."""
     import shutil
@@ -254,40 +475,41 @@ def create_git_worktree(source_path, dest_path, branch_name):
         # Work in the source repo to prepare it
         print("Preparing source repository...")
 
-        # Stash any uncommitted changes in source
-        status_result = run_command("git status --porcelain", cwd=source_path)
-        if status_result and status_result.strip():
-            print("Found uncommitted changes in source, stashing them...")
-            run_command(
-                "git stash push -m 'Auto-stash before worktree creation'",
-                cwd=source_path,
-            )
-
         # Try to fetch latest changes if remote exists
-        remote_check = run_command("git remote", cwd=source_path)
-        if remote_check and remote_check.strip():
-            print("Fetching latest changes...")
-            run_command("git fetch origin", cwd=source_path)
-
-        # Find and checkout main/master branch
-        main_branch = None
-        for branch in ["main", "master"]:
-            checkout_result = run_command(f"git checkout {branch}", cwd=source_path)
-            if checkout_result is not None:
-                main_branch = branch
-                print(f"Checked out {branch} branch in source repository")
-                break
+        if recently_fetched(source_path):
+            print("Fetched recently, skipping fetch")
+        else:
+            remote_check = run_command(["git", "remote"], cwd=source_path)
+            if remote_check and remote_check.strip():
+                print("Fetching latest changes...")
+                run_command(["git", "fetch", "origin"], cwd=source_path)
+
+        # Find main/master in one probe; the worktree is based on it directly,
+        # so the source checkout (and its uncommitted changes) is left alone
+        refs = run_command(
+            [
+                "git",
+                "for-each-ref",
+                "--format=%(refname:short)",
+                "refs/heads/main",
+                "refs/heads/master",
+            ],
+            cwd=source_path,
+        )
+        found = refs.split() if refs else []
+        main_branch = next((b for b in ("main", "master") if b in found), None)
 
-        if not main_branch:
+        if main_branch:
+            print(f"Using {main_branch} branch from source repository")
+        else:
             print("Warning: Could not find main or master branch, using current branch")
-            # Get current branch name
-            current_branch = run_command("git branch --show-current", cwd=source_path)
-            main_branch = current_branch.strip() if current_branch else "HEAD"
+            main_branch = "HEAD"
 
         # Create the worktree with new branch
         print(f"Creating worktree with branch '{branch_name}'...")
         worktree_result = run_command(
-            f"git worktree add {dest_path} -b {branch_name}", cwd=source_path
+            ["git", "worktree", "add", str(dest_path), "-b", branch_name, main_branch],
+            cwd=source_path,
         )
 
         if worktree_result is None:
@@ -307,70 +529,213 @@ def copy_non_git_directory(source_path, dest_path, branch_name):
     """Copy non-git directory or fallback copy method."""
     import shutil
 
-    print(f"Copying directory from {source_path} to {dest_path}")
-    shutil.copytree(source_path, dest_path)
-
-    # Remove virtual environment directories
-    venv_dirs = ["venv", "env", ".venv"]
-    for venv_dir in venv_dirs:
-        venv_path = dest_path / venv_dir
-        if venv_path.exists():
-            print(f"Removing virtual environment directory: {venv_path}")
-            shutil.rmtree(venv_path)
+    # Git sources are cloned so objects are hardlinked rather than copied
+    cloned = is_git_repo(source_path) and clone_local_repo(source_path, dest_path)
+    if not cloned:
+        print(f"Copying directory from {source_path} to {dest_path}")
+        shutil.copytree(
+            source_path,
+            dest_path,
+            ignore=_copy_ignore(source_path),
+            copy_function=_reflink_copy,
+        )
 
     # If destination has .git, perform git operations
     if is_git_repo(dest_path):
-        # Check if there are any uncommitted changes and stash them
-        status_result = run_command("git status --porcelain", cwd=dest_path)
-        if status_result and status_result.strip():
-            print("Found uncommitted changes, stashing them...")
-            stash_result = run_command(
-                "git stash push -m 'Auto-stash before reset to main'", cwd=dest_path
-            )
-            if stash_result is None:
-                print("Failed to stash changes, performing hard reset...")
-
-        # Try to fetch latest changes if remote exists
-        remote_check = run_command("git remote", cwd=dest_path)
-        if remote_check and remote_check.strip():
-            print("Fetching latest changes...")
-            fetch_result = run_command("git fetch origin", cwd=dest_path)
-            has_remote = fetch_result is not None
+        # Try to fetch latest changes if remote exists; a copied FETCH_HEAD
+        # keeps its mtime, so a recent fetch in the source carries over
+        if recently_fetched(dest_path):
+            print("Fetched recently, skipping fetch")
+            has_remote = True
         else:
-            print("No remote repository configured, skipping fetch")
-            has_remote = False
+            # A fresh clone always has an origin
+            remote_check = (
+                "origin" if cloned else run_command(["git", "remote"], cwd=dest_path)
+            )
+            if remote_check and remote_check.strip():
+                print("Fetching latest changes...")
+                fetch_result = run_command(["git", "fetch", "origin"], cwd=dest_path)
+                has_remote = fetch_result is not None
+            else:
+                print("No remote repository configured, skipping fetch")
+                has_remote = False
 
+        # The copy is throwaway, so checkouts are forced and discard any local
+        # changes instead of probing with git status and stashing them
         # Try to checkout main/master branch
         for main_branch in ["main", "master"]:
             print(f"Attempting to checkout {main_branch} branch...")
-            checkout_result = run_command(f"git checkout {main_branch}", cwd=dest_path)
+            if has_remote:
+                # Check out and reset to the latest origin in a single git call
+                reset_result = run_command(
+                    [
+                        "git",
+                        "checkout",
+                        "-f",
+                        "-B",
+                        main_branch,
+                        f"origin/{main_branch}",
+                    ],
+                    cwd=dest_path,
+                )
+                if reset_result is not None:
+                    print(f"Successfully reset to origin/{main_branch}")
+                    break
+
+            checkout_result = run_command(
+                ["git", "checkout", "-f", main_branch], cwd=dest_path
+            )
             if checkout_result is not None:
                 if has_remote:
-                    # Reset to latest origin if we have a remote
-                    reset_result = run_command(
-                        f"git reset --hard origin/{main_branch}", cwd=dest_path
+                    print(
+                        f"Failed to reset to origin/{main_branch}, using local {main_branch}"
                     )
-                    if reset_result is not None:
-                        print(f"Successfully reset to origin/{main_branch}")
-                        break
-                    else:
-                        print(
-                            f"Failed to reset to origin/{main_branch}, using local {main_branch}"
-                        )
-                        break
                 else:
                     print(f"Successfully checked out local {main_branch} branch")
-                    break
+                break
             else:
                 print(f"Branch {main_branch} not found")
         else:
             print(
                 "Warning: Could not find main or master branch, staying on current branch"
             )
+            if cloned:
+                # The clone was made without a checkout, so populate the tree
+                run_command(["git", "checkout", "-f"], cwd=dest_path)
+
+    return True
+
+
+def _copy_ignore(source_path):
+    """Return a copytree ignore callable that skips venvs and cache directories."""
+    root = os.fspath(source_path)
+
+    def ignore(directory, names):
+        skipped = {
+            name for name in names if name in _CACHE_DIRS or name.endswith(".pyc")
+        }
+        if directory == root:
+            for name in _VENV_DIRS.intersection(names):
+                print(f"Skipping virtual environment directory: {name}")
+                skipped.add(name)
+        return skipped
+
+    return ignore
+
 
+def _clone_file(src, dst):
+    """Create dst as a copy-on-write clone of src, raising OSError if unsupported."""
+    if sys.platform == "darwin":
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), dst)
+        return
+
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+
+
+def _reflink_copy(src, dst):
+    """copytree copy_function that clones files when the filesystem allows it."""
+    import shutil
+
+    global _reflink_supported
+    if _reflink_supported:
+        try:
+            _clone_file(src, dst)
+            shutil.copystat(src, dst)
+            return dst
+        except (OSError, AttributeError, ImportError):
+            # Not a CoW filesystem (or no clone API); stop trying for this run
+            _reflink_supported = False
+            if os.path.lexists(dst):
+                os.unlink(dst)
+    return shutil.copy2(src, dst)
+
+
+def clone_local_repo(source_path, dest_path):
+    """Clone a local git repository without copying its object files."""
+    print(f"Cloning repository from {source_path} to {dest_path}")
+    # --local hardlinks .git/objects; the branch is checked out by the caller
+    clone_result = run_command(
+        ["git", "clone", "--local", "--no-checkout", str(source_path), str(dest_path)]
+    )
+    if clone_result is None:
+        print("Failed to clone repository, falling back to directory copy")
+        return False
+
+    # Point origin at the source's upstream instead of the source directory
+    # Sources without a remote are normal, so a failed lookup isn't reported
+    origin_url = run_command(
+        ["git", "remote", "get-url", "origin"], cwd=source_path, quiet=True
+    )
+    if origin_url and origin_url.strip():
+        run_command(
+            ["git", "remote", "set-url", "origin", origin_url.strip()], cwd=dest_path
+        )
     return True
 
 
+def _url_clone_command(repo_url, dest_name):
+    """Build the clone command for a remote repository URL."""
+    # Blobless clone: full history, file contents fetched on demand
+    return ["git", "clone", "--filter=blob:none", repo_url, dest_name]
+
+
+def clone_in_background(repo_url, workspace_path):
+    """Start cloning repo_url into a temporary workspace directory, or return None."""
+    # _scan_staged_dirs leaves this prefix out of 'mcl ls' and 'mcl cd'
+    tmp_path = Path(workspace_path) / f"{_CLONE_TMP_PREFIX}{os.getpid()}"
+    cmd = _url_clone_command(repo_url, tmp_path.name)
+    try:
+        process = subprocess.Popen(
+            cmd,
+            cwd=workspace_path,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    except OSError as e:
+        # Same report as run_command; the caller then clones in the foreground
+        print(f"Error running command '{shlex.join(cmd)}': {e}")
+        return None
+    return tmp_path, process
+
+
+def finish_background_clone(background_clone, dest_path):
+    """Wait for a background clone and move it to dest_path; return success."""
+    import shutil
+
+    tmp_path, process = background_clone
+    _, stderr = process.communicate()
+    if process.returncode == 0:
+        tmp_path.rename(dest_path)
+        return True
+    print(
+        f"Error running command '{shlex.join(process.args)}': "
+        f"exit status {process.returncode}"
+    )
+    if stderr:
+        print(f"Error output: {stderr}")
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    return False
+
+
+def cancel_background_clone(background_clone):
+    """Stop a background clone and remove its temporary directory."""
+    import shutil
+
+    tmp_path, process = background_clone
+    process.terminate()
+    process.communicate()
+    shutil.rmtree(tmp_path, ignore_errors=True)
+
+
 # Maintain backward compatibility
 def copy_local_repo(source_path, dest_path, branch_name):
     """Legacy function name - now delegates to setup_local_repo."""
@@ -395,7 +760,7 @@ def cleanup_worktree(repo_path, source_path=None):
                 # Use git worktree remove command
                 if source_path and is_git_repo(source_path):
                     remove_result = run_command(
-                        f"git worktree remove {repo_path}", cwd=source_path
+                        ["git", "worktree", "remove", str(repo_path)], cwd=source_path
                     )
                     if remove_result is not None:
                         print(f"Successfully removed worktree")
@@ -414,9 +779,23 @@ def cleanup_worktree(repo_path, source_path=None):
     return False
 
 
-def create_task_memory(requirements, repo_path, branch_name):
+def _write_file(path, content, append=False):
+    """Write text as UTF-8 through a raw file descriptor, truncating or appending."""
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC)
+    # Same creation mode as open(): the umask decides the final permissions
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(content.encode("utf-8"))
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def create_task_memory(requirements, repo_path, branch_name, timestamp=None):
     """Create TASK_MEMORY.md file with requirements and instructions."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     content = f"""# Task Memory
 
@@ -446,24 +825,35 @@ def create_task_memory(requirements, repo_path, branch_name):
 *This file serves as your working memory for this task. Keep it updated as you progress through the implementation.*
 """
 
-    memory_file = os.path.join(repo_path, "TASK_MEMORY.md")
-    with open(memory_file, "w") as f:
-        f.write(content)
+    memory_file = Path(repo_path) / "TASK_MEMORY.md"
+    _write_file(memory_file, content)
 
     print(f"Created TASK_MEMORY.md in {memory_file}")
     return memory_file
 
 
+def _scan_staged_dirs(staging_dir):
+    """Return (mtime, name, path) for each staged task, newest first."""
+    # scandir gives us is_dir without a stat
+    with os.scandir(staging_dir) as it:
+        entries = [
+            (entry.stat().st_mtime, entry.name, entry.path)
+            for entry in it
+            if entry.is_dir() and not entry.name.startswith(_CLONE_TMP_PREFIX)
+        ]
+    entries.sort(key=itemgetter(0), reverse=True)
+    return entries
+
+
 def list_staged_directories(staging_dir=None):
     """List staged tasks with Rich formatting."""
-    from datetime import datetime
+    if HAS_RICH:
+        from rich import box
+        from rich.console import Console
+        from rich.table import Table
 
     # Get staging directory
-    if staging_dir is None:
-        home_dir = Path.home()
-        staging_dir = home_dir / ".mcl" / "staging"
-    else:
-        staging_dir = Path(staging_dir)
+    staging_dir = _DEFAULT_STAGING if staging_dir is None else Path(staging_dir)
 
     if not staging_dir.exists():
         if HAS_RICH:
@@ -473,26 +863,8 @@ def list_staged_directories(staging_dir=None):
             print(f"Staging directory {staging_dir} does not exist.")
         return
 
-    # Find all directories in staging
-    staged_dirs = []
-    for item in staging_dir.iterdir():
-        if item.is_dir():
-            # Get last modified time for sorting
-            mtime = item.stat().st_mtime
-            dir_name = item.name
-
-            staged_dirs.append(
-                {
-                    "name": dir_name,
-                    "path": str(item),
-                    "mtime": mtime,
-                    "modified": datetime.fromtimestamp(mtime).strftime(
-                        "%Y-%m-%d %H:%M"
-                    ),
-                }
-            )
-
-    if not staged_dirs:
+    entries = _scan_staged_dirs(staging_dir)
+    if not entries:
         if HAS_RICH:
             console = Console()
             console.print("[yellow]No tasks found.[/yellow]")
@@ -500,8 +872,15 @@ def list_staged_directories(staging_dir=None):
             print("No tasks found.")
         return
 
-    # Sort by modification time (newest first)
-    staged_dirs.sort(key=lambda x: x["mtime"], reverse=True)
+    staged_dirs = [
+        {
+            "name": name,
+            "path": path,
+            "mtime": mtime,
+            "modified": time.strftime("%Y-%m-%d %H:%M", time.localtime(mtime)),
+        }
+        for mtime, name, path in entries
+    ]
 
     # Display with Rich formatting if available
     if HAS_RICH:
@@ -546,41 +925,27 @@ def list_staged_directories(staging_dir=None):
 
 def handle_cd_command(staging_dir, selection):
     """Handle the --cd command for shell integration."""
-    # Get staging directory
+    # This runs on every mcl_cd call, so stay on plain strings and scandir
     if staging_dir is None:
-        home_dir = Path.home()
-        staging_dir = home_dir / ".mcl" / "staging"
-    else:
-        staging_dir = Path(staging_dir)
+        staging_dir = _DEFAULT_STAGING
 
-    if not staging_dir.exists():
+    try:
+        staged_dirs = _scan_staged_dirs(staging_dir)
+    except (FileNotFoundError, NotADirectoryError):
         print(
             "echo 'No tasks found - staging directory does not exist'", file=sys.stderr
         )
         sys.exit(1)
 
-    # Find all directories in staging
-    staged_dirs = []
-    for item in staging_dir.iterdir():
-        if item.is_dir():
-            mtime = item.stat().st_mtime
-            staged_dirs.append({"name": item.name, "path": str(item), "mtime": mtime})
-
     if not staged_dirs:
         print("echo 'No tasks found'", file=sys.stderr)
         sys.exit(1)
 
-    # Sort by modification time (newest first)
-    staged_dirs.sort(key=lambda x: x["mtime"], reverse=True)
-
     try:
         index = int(selection) - 1
         if 0 <= index < len(staged_dirs):
-            selected_dir = staged_dirs[index]
             # Output shell command to change directory - use proper shell escaping
-            import shlex
-
-            print(f"cd {shlex.quote(selected_dir['path'])}")
+            print(f"cd {shlex.quote(staged_dirs[index][2])}")
         else:
             print("echo 'Invalid selection'", file=sys.stderr)
             sys.exit(1)
@@ -589,12 +954,8 @@ def handle_cd_command(staging_dir, selection):
         sys.exit(1)
 
 
-def generate_shell_integration():
-    """Generate shell integration code for bash/zsh."""
-    # Get the absolute path to this script
-    script_path = os.path.abspath(__file__)
-
-    shell_code = f'''
+# Shell code emitted by shell-init; {script_path} is filled in per call
+_SHELL_CODE_TEMPLATE = '''
 # Multi-Claude (mcl) shell integration
 # Add this to your ~/.bashrc or ~/.zshrc: eval "$(python {script_path} shell-init)"
 
@@ -603,8 +964,8 @@ mcl_cd() {{
         # No arguments - show list
         python "{script_path}" ls
     else
-        # Change to task by number
-        local dir_command=$(python "{script_path}" cd "$1")
+        # Change to task by number (-S: cd only needs the stdlib)
+        local dir_command=$(python -S "{script_path}" cd "$1")
         if [[ $? -eq 0 ]] && [[ -n "$dir_command" ]]; then
             eval "$dir_command"
         fi
@@ -618,8 +979,8 @@ _mcl_cd_complete() {{
     local staging_dir="$HOME/.mcl/staging"
     
     if [[ -d "$staging_dir" ]]; then
-        local count=$(find "$staging_dir" -maxdepth 1 -type d | wc -l)
-        count=$((count - 1))  # Subtract 1 for the staging directory itself
+        # Same entries as 'mcl ls': skip in-progress background clones
+        local count=$(find "$staging_dir" -mindepth 1 -maxdepth 1 -type d ! -name '.mcl-clone-*' | wc -l)
         
         if [[ $count -gt 0 ]]; then
             COMPREPLY=($(compgen -W "$(seq 1 $count)" -- "$cur"))
@@ -630,16 +991,85 @@ _mcl_cd_complete() {{
 # Register completion for bash
 if [[ -n "$BASH_VERSION" ]]; then
     complete -F _mcl_cd_complete mcl_cd
-fi'''
-    return shell_code.strip()
+fi'''.strip()
+
+
+def generate_shell_integration():
+    """Generate shell integration code for bash/zsh."""
+    # Get the absolute path to this script
+    return _render_shell_integration(os.path.abspath(__file__))
+
+
+@lru_cache(maxsize=None)
+def _render_shell_integration(script_path):
+    """Fill the shell integration template in for a script path."""
+    return _SHELL_CODE_TEMPLATE.format(script_path=script_path)
 
 
 # Manager functionality
+_SCHEMA_VERSION = 3  # bump when _init_db's schema changes
+
+# Risk indicators with weights
+_RISK_INDICATORS = {
+    # Critical risk (0.9-1.0)
+    "destructive": ["rm -rf", "delete", "drop table", "truncate", "format"],
+    "system": ["sudo", "chmod 777", "chown", "passwd"],
+    "network": ["curl -X DELETE", "wget", "ssh", "scp"],
+
+    # High risk (0.6-0.8)
+    "database": ["alter table", "create table", "migration", "schema"],
+    "config": ["config", "settings", ".env", "credentials"],
+    "external": ["http", "api", "webhook"],
+
+    # Medium risk (0.3-0.5)
+    "files": ["write", "edit", "move", "copy"],
+    "install": ["npm install", "pip install", "apt install"],
+
+    # Low risk (0.0-0.2)
+    "read": ["read", "cat", "ls", "grep", "search"],
+    "test": ["test", "pytest", "jest", "spec"]
+}
+
+_RISK_WEIGHTS = {
+    "destructive": 1.0, "system": 0.95, "network": 0.9,
+    "database": 0.7, "config": 0.6, "external": 0.6,
+    "files": 0.4, "install": 0.3,
+    "read": 0.1, "test": 0.1
+}
+
+# (keyword, weight) pairs, heaviest first, so the first hit is the maximum
+_RISK_KEYWORDS = sorted(
+    ((keyword, _RISK_WEIGHTS[category])
+     for category, keywords in _RISK_INDICATORS.items()
+     for keyword in keywords),
+    key=itemgetter(1),
+    reverse=True,
+)
+
+# Autonomy level -> (confidence threshold, risk threshold, escalate percentage)
+_THRESHOLDS = {
+    "conservative": (0.8, 0.3, 0.7),  # Escalate 70% of requests
+    "balanced": (0.6, 0.5, 0.4),  # Escalate 40% of requests
+    "aggressive": (0.4, 0.7, 0.2),  # Escalate 20% of requests
+}
+
+_DIRECTION_INDICATOR = {
+    "agent_to_manager": "🤖→🧠",
+    "manager_to_agent": "🧠→🤖",
+}
+
+_INSERT_INTERACTION_SQL = """
+    INSERT INTO interaction_logs
+    (agent_id, session_id, interaction_type, direction, content, metadata)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
 class ManagerDaemon:
     """Daemon process that manages multiple Claude Code agents."""
     
     def __init__(self, manager_dir=None):
-        self.manager_dir = Path(manager_dir or Path.home() / ".mcl" / "manager")
+        self.manager_dir = Path(manager_dir or _MCL_HOME / "manager")
         self.agents_dir = self.manager_dir / "agents"
         self.db_path = self.manager_dir / "manager.db"
         self.socket_path = "/tmp/mcl_manager.sock"
@@ -651,11 +1081,28 @@ class ManagerDaemon:
         self.agents_dir.mkdir(parents=True, exist_ok=True)
         
         # Initialize database
+        self._lock = threading.RLock()
+        self._config_cache = {}
+        self._config_version = None
         self._init_db()
     
     def _init_db(self):
         """Initialize SQLite database for manager state."""
-        conn = sqlite3.connect(self.db_path)
+        # One autocommit connection is reused by every method; WAL lets
+        # readers in other processes proceed while the daemon writes
+        conn = self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        self._has_fts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'interaction_logs_fts'"
+        ).fetchone() is not None
+        if conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION:
+            return
         conn.execute("""
             CREATE TABLE IF NOT EXISTS agents (
                 id TEXT PRIMARY KEY,
@@ -711,8 +1158,80 @@ class ManagerDaemon:
                 FOREIGN KEY (agent_id) REFERENCES agents (id)
             )
         """)
-        conn.commit()
-        conn.close()
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_agents_status ON agents (status)")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_queue_created ON approval_queue (created_at)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_logs_agent_ts ON interaction_logs (agent_id, timestamp)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_decisions_agent ON manager_decisions (agent_id, created_at)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_logs_session_ts ON interaction_logs (session_id, timestamp)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_decisions_created ON manager_decisions (created_at)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_decisions_feedback ON manager_decisions (user_feedback, created_at)"
+        )
+        self._has_fts = self._init_log_search(conn)
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    
+    def _init_log_search(self, conn):
+        """Create the trigram full-text index over log content, if supported."""
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS interaction_logs_fts USING fts5(
+                    content, content='interaction_logs', content_rowid='id',
+                    tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            return False  # SQLite built without FTS5 or older than 3.34
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS interaction_logs_fts_ai
+            AFTER INSERT ON interaction_logs BEGIN
+                INSERT INTO interaction_logs_fts (rowid, content) VALUES (new.id, new.content);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS interaction_logs_fts_ad
+            AFTER DELETE ON interaction_logs BEGIN
+                INSERT INTO interaction_logs_fts (interaction_logs_fts, rowid, content)
+                VALUES ('delete', old.id, old.content);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS interaction_logs_fts_au
+            AFTER UPDATE ON interaction_logs BEGIN
+                INSERT INTO interaction_logs_fts (interaction_logs_fts, rowid, content)
+                VALUES ('delete', old.id, old.content);
+                INSERT INTO interaction_logs_fts (rowid, content) VALUES (new.id, new.content);
+            END
+        """)
+        # Index rows logged before the table existed
+        conn.execute("INSERT INTO interaction_logs_fts (interaction_logs_fts) VALUES ('rebuild')")
+        return True
+    
+    def close(self):
+        """Close the manager database connection."""
+        # Only re-analyzes tables whose statistics are missing or stale
+        self._conn.execute("PRAGMA optimize")
+        self._conn.close()
+    
+    @contextmanager
+    def _transaction(self):
+        """Group the enclosed writes into one commit, rolling back on error."""
+        with self._lock:
+            if self._conn.in_transaction:
+                yield
+                return
+            with self._conn:
+                self._conn.execute("BEGIN")
+                yield
     
     def spawn_agent(self, task_description, repo_path, priority="normal", budget=100):
         """Spawn a new Claude Code agent for a task."""
@@ -722,6 +1241,8 @@ class ManagerDaemon:
         if not task_description or not task_description.strip():
             raise ValueError("Task description cannot be empty")
         
+        import uuid
+
         agent_id = str(uuid.uuid4())[:8]
         agent_dir = self.agents_dir / agent_id
         agent_dir.mkdir(exist_ok=True)
@@ -762,89 +1283,83 @@ This agent is running under manager supervision:
 *This agent is managed by the mcl manager daemon. All tool requests are evaluated before execution.*
 """
         
-        task_memory_path = agent_dir / "TASK_MEMORY.md"
-        with open(task_memory_path, "w") as f:
-            f.write(task_memory_content)
+        _write_file(agent_dir / "TASK_MEMORY.md", task_memory_content)
         
-        # Store agent in database
-        conn = sqlite3.connect(self.db_path)
-        conn.execute(
-            "INSERT INTO agents (id, task_description, repo_path, status, priority, budget) VALUES (?, ?, ?, ?, ?, ?)",
-            (agent_id, task_description, repo_path, "active", priority, budget)
-        )
-        conn.commit()
-        conn.close()
-        
-        # Initialize logging for this agent
+        # Store the agent and its spawn event in a single transaction
         session_id = f"session_{int(time.time())}"
-        self.log_interaction(
-            agent_id=agent_id,
-            session_id=session_id,
-            interaction_type="system_event",
-            direction="system",
-            content=f"Agent spawned for task: {task_description}",
-            metadata={
-                "repo_path": repo_path,
-                "priority": priority,
-                "budget": budget,
-                "agent_dir": str(agent_dir)
-            }
-        )
+        metadata = {
+            "repo_path": repo_path,
+            "priority": priority,
+            "budget": budget,
+            "agent_dir": str(agent_dir)
+        }
+        with self._transaction():
+            self._conn.execute(
+                "INSERT INTO agents (id, task_description, repo_path, status, priority, budget) VALUES (?, ?, ?, ?, ?, ?)",
+                (agent_id, task_description, repo_path, "active", priority, budget)
+            )
+            self._conn.execute(
+                _INSERT_INTERACTION_SQL,
+                (agent_id, session_id, "system_event", "system",
+                 f"Agent spawned for task: {task_description}", _json_dumps(metadata))
+            )
         
         print(f"✅ Agent {agent_id} spawned for task: {task_description[:50]}...")
         return agent_id, session_id
     
     def get_active_agents(self):
         """Get list of active agents."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute(
-            "SELECT id, task_description, repo_path, status, priority, created_at FROM agents WHERE status = 'active'"
-        )
-        agents = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT id, task_description, repo_path, status, priority, created_at FROM agents WHERE status = 'active'"
+            )
+            agents = cursor.fetchall()
         return agents
     
     def get_approval_queue(self):
         """Get pending approval requests."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute("""
-            SELECT aq.id, aq.agent_id, aq.request_type, aq.request_data, aq.created_at, a.task_description
-            FROM approval_queue aq
-            JOIN agents a ON aq.agent_id = a.id
-            ORDER BY aq.created_at
-        """)
-        queue = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.execute("""
+                SELECT aq.id, aq.agent_id, aq.request_type, aq.request_data, aq.created_at, a.task_description
+                FROM approval_queue aq
+                JOIN agents a ON aq.agent_id = a.id
+                ORDER BY aq.created_at
+            """)
+            queue = cursor.fetchall()
         return queue
     
+    def _get_config(self, key, default):
+        """Read a manager_config value, cached until another connection writes."""
+        with self._lock:
+            # data_version only moves on commits from other connections
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if version != self._config_version:
+                self._config_cache.clear()
+                self._config_version = version
+            if key not in self._config_cache:
+                row = self._conn.execute("SELECT value FROM manager_config WHERE key = ?", (key,)).fetchone()
+                self._config_cache[key] = row[0] if row else default
+            return self._config_cache[key]
+    
     def get_autonomy_level(self):
         """Get current autonomy level."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute("SELECT value FROM manager_config WHERE key = 'autonomy_level'")
-        row = cursor.fetchone()
-        conn.close()
-        return row[0] if row else "balanced"  # Default to balanced
+        return self._get_config("autonomy_level", "balanced")  # Default to balanced
     
     def set_autonomy_level(self, level):
         """Set autonomy level: conservative, balanced, aggressive."""
         if level not in ["conservative", "balanced", "aggressive"]:
             raise ValueError("Autonomy level must be: conservative, balanced, or aggressive")
         
-        conn = sqlite3.connect(self.db_path)
-        conn.execute(
-            "INSERT OR REPLACE INTO manager_config (key, value) VALUES (?, ?)",
-            ("autonomy_level", level)
-        )
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO manager_config (key, value) VALUES (?, ?)",
+                ("autonomy_level", level)
+            )
+            self._config_cache["autonomy_level"] = level
     
     def get_evaluation_model(self):
         """Get current evaluation model."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute("SELECT value FROM manager_config WHERE key = 'evaluation_model'")
-        row = cursor.fetchone()
-        conn.close()
-        return row[0] if row else "claude-3.5-sonnet"  # Default
+        return self._get_config("evaluation_model", "claude-3.5-sonnet")  # Default
     
     def set_evaluation_model(self, model):
         """Set evaluation model: gpt-4o, claude-3.5-sonnet, gpt-4-turbo, etc."""
@@ -856,28 +1371,26 @@ This agent is running under manager supervision:
         if model not in valid_models:
             raise ValueError(f"Model must be one of: {', '.join(valid_models)}")
             
-        conn = sqlite3.connect(self.db_path)
-        conn.execute(
-            "INSERT OR REPLACE INTO manager_config (key, value) VALUES (?, ?)",
-            ("evaluation_model", model)
-        )
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO manager_config (key, value) VALUES (?, ?)",
+                ("evaluation_model", model)
+            )
+            self._config_cache["evaluation_model"] = model
     
     def calculate_confidence_score(self):
         """Calculate manager's current confidence score based on historical accuracy."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute("""
-            SELECT 
-                COUNT(*) as total_decisions,
-                SUM(CASE WHEN user_feedback = 'correct' THEN 1 ELSE 0 END) as correct_decisions,
-                AVG(confidence_score) as avg_confidence
-            FROM manager_decisions 
-            WHERE user_feedback IS NOT NULL
-            AND created_at > datetime('now', '-30 days')
-        """)
-        row = cursor.fetchone()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.execute("""
+                SELECT 
+                    COUNT(*) as total_decisions,
+                    SUM(CASE WHEN user_feedback = 'correct' THEN 1 ELSE 0 END) as correct_decisions,
+                    AVG(confidence_score) as avg_confidence
+                FROM manager_decisions 
+                WHERE user_feedback IS NOT NULL
+                AND created_at > datetime('now', '-30 days')
+            """)
+            row = cursor.fetchone()
         
         if not row or row[0] == 0:
             return 0.5  # Default neutral confidence
@@ -889,177 +1402,130 @@ This agent is running under manager supervision:
         confidence_score = (accuracy * 0.7) + ((avg_confidence or 0.5) * 0.3)
         return min(max(confidence_score, 0.0), 1.0)
     
-    def should_escalate(self, request_data, confidence_score):
+    def should_escalate(self, request_data, confidence_score, request_json=None):
         """Determine if request should be escalated based on autonomy level and confidence."""
         autonomy_level = self.get_autonomy_level()
         
         # Parse risk indicators from request
-        risk_score = self._assess_risk(request_data)
-        
-        # Autonomy thresholds
-        thresholds = {
-            "conservative": {
-                "confidence_threshold": 0.8,
-                "risk_threshold": 0.3,
-                "escalate_percentage": 0.7  # Escalate 70% of requests
-            },
-            "balanced": {
-                "confidence_threshold": 0.6,
-                "risk_threshold": 0.5,
-                "escalate_percentage": 0.4  # Escalate 40% of requests
-            },
-            "aggressive": {
-                "confidence_threshold": 0.4,
-                "risk_threshold": 0.7,
-                "escalate_percentage": 0.2  # Escalate 20% of requests
-            }
-        }
+        risk_score = self._assess_risk(request_data, request_json)
         
-        config = thresholds[autonomy_level]
+        confidence_threshold, risk_threshold, escalate_percentage = _THRESHOLDS[autonomy_level]
         
         # Decision logic
-        if risk_score > config["risk_threshold"]:
+        if risk_score > risk_threshold:
             return True  # High risk always escalates
-        if confidence_score < config["confidence_threshold"]:
+        if confidence_score < confidence_threshold:
             return True  # Low confidence escalates
         
         # Random escalation based on autonomy level (for learning)
         import random
-        if random.random() < config["escalate_percentage"] * (1 - confidence_score):
+        if random.random() < escalate_percentage * (1 - confidence_score):
             return True
         
         return False
     
-    def _assess_risk(self, request_data):
+    def _assess_risk(self, request_data, request_json=None):
         """Assess risk level of a request (0.0 = safe, 1.0 = dangerous)."""
-        request_str = json.dumps(request_data).lower()
-        
-        # Risk indicators with weights
-        risk_indicators = {
-            # Critical risk (0.9-1.0)
-            "destructive": ["rm -rf", "delete", "drop table", "truncate", "format"],
-            "system": ["sudo", "chmod 777", "chown", "passwd"],
-            "network": ["curl -X DELETE", "wget", "ssh", "scp"],
-            
-            # High risk (0.6-0.8)
-            "database": ["alter table", "create table", "migration", "schema"],
-            "config": ["config", "settings", ".env", "credentials"],
-            "external": ["http", "api", "webhook"],
-            
-            # Medium risk (0.3-0.5) 
-            "files": ["write", "edit", "move", "copy"],
-            "install": ["npm install", "pip install", "apt install"],
-            
-            # Low risk (0.0-0.2)
-            "read": ["read", "cat", "ls", "grep", "search"],
-            "test": ["test", "pytest", "jest", "spec"]
-        }
+        # Callers that already serialized the request pass it to skip a dumps
+        request_str = (request_json or json.dumps(request_data)).lower()
         
-        risk_weights = {
-            "destructive": 1.0, "system": 0.95, "network": 0.9,
-            "database": 0.7, "config": 0.6, "external": 0.6,
-            "files": 0.4, "install": 0.3,
-            "read": 0.1, "test": 0.1
-        }
+        for keyword, weight in _RISK_KEYWORDS:
+            if keyword in request_str:
+                return weight
         
-        max_risk = 0.0
-        for category, keywords in risk_indicators.items():
-            for keyword in keywords:
-                if keyword in request_str:
-                    max_risk = max(max_risk, risk_weights[category])
-        
-        return max_risk
+        return 0.0
     
     def record_decision(self, agent_id, request_data, decision, confidence_score, model_used, session_id=None):
         """Record a manager decision for learning purposes."""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("""
-            INSERT INTO manager_decisions 
-            (agent_id, request_data, decision, confidence_score, autonomy_level, model_used)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (agent_id, json.dumps(request_data), decision, confidence_score, 
-              self.get_autonomy_level(), model_used))
-        conn.commit()
-        conn.close()
-        
-        # Log the interaction
+        autonomy_level = self.get_autonomy_level()
         if not session_id:
             session_id = f"session_{int(time.time())}"
         
-        # Log the agent request
-        self.log_interaction(
-            agent_id=agent_id,
-            session_id=session_id,
-            interaction_type="agent_request",
-            direction="agent_to_manager",
-            content=json.dumps(request_data, indent=2),
-            metadata={
-                "tool": request_data.get("tool"),
-                "risk_assessment": "pending"
-            }
-        )
-        
-        # Log the manager decision
-        self.log_interaction(
-            agent_id=agent_id,
-            session_id=session_id,
-            interaction_type="manager_response",
-            direction="manager_to_agent",
-            content=f"Decision: {decision.upper()}",
-            metadata={
-                "confidence_score": confidence_score,
-                "autonomy_level": self.get_autonomy_level(),
-                "model_used": model_used,
-                "decision_reasoning": f"Confidence: {confidence_score:.2f}, Autonomy: {self.get_autonomy_level()}"
-            }
-        )
+        # The decision and both of its log entries share one commit
+        with self._transaction():
+            self._conn.execute("""
+                INSERT INTO manager_decisions 
+                (agent_id, request_data, decision, confidence_score, autonomy_level, model_used)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (agent_id, _json_dumps(request_data), decision, confidence_score, 
+                  autonomy_level, model_used))
+            
+            # Log the agent request and the manager decision
+            self.log_interactions_bulk([
+                (agent_id, session_id, "agent_request", "agent_to_manager",
+                 json.dumps(request_data, indent=2),
+                 _json_dumps({
+                     "tool": request_data.get("tool"),
+                     "risk_assessment": "pending"
+                 })),
+                (agent_id, session_id, "manager_response", "manager_to_agent",
+                 f"Decision: {decision.upper()}",
+                 _json_dumps({
+                     "confidence_score": confidence_score,
+                     "autonomy_level": autonomy_level,
+                     "model_used": model_used,
+                     "decision_reasoning": f"Confidence: {confidence_score:.2f}, Autonomy: {autonomy_level}"
+                 })),
+            ])
     
     def provide_feedback(self, decision_id, feedback):
         """Provide feedback on a manager decision (correct/incorrect)."""
         if feedback not in ["correct", "incorrect"]:
             raise ValueError("Feedback must be 'correct' or 'incorrect'")
         
-        conn = sqlite3.connect(self.db_path)
-        conn.execute(
-            "UPDATE manager_decisions SET user_feedback = ? WHERE id = ?",
-            (feedback, decision_id)
-        )
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE manager_decisions SET user_feedback = ? WHERE id = ?",
+                (feedback, decision_id)
+            )
     
     def get_decision_history(self, limit=20):
         """Get recent manager decisions for review."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute("""
-            SELECT md.id, md.agent_id, a.task_description, md.decision, 
-                   md.confidence_score, md.autonomy_level, md.model_used,
-                   md.user_feedback, md.created_at
-            FROM manager_decisions md
-            JOIN agents a ON md.agent_id = a.id
-            ORDER BY md.created_at DESC
-            LIMIT ?
-        """, (limit,))
-        decisions = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.execute("""
+                SELECT md.id, md.agent_id, a.task_description, md.decision, 
+                       md.confidence_score, md.autonomy_level, md.model_used,
+                       md.user_feedback, md.created_at
+                FROM manager_decisions md
+                JOIN agents a ON md.agent_id = a.id
+                ORDER BY md.created_at DESC
+                LIMIT ?
+            """, (limit,))
+            decisions = cursor.fetchall()
         return decisions
     
+    def get_stats(self):
+        """Get decision and feedback counts for the last 7 days."""
+        with self._lock:
+            cursor = self._conn.execute("""
+                SELECT 
+                    COUNT(*) as total,
+                    SUM(CASE WHEN decision = 'approve' THEN 1 ELSE 0 END) as approved,
+                    SUM(CASE WHEN decision = 'escalate' THEN 1 ELSE 0 END) as escalated,
+                    SUM(CASE WHEN user_feedback = 'correct' THEN 1 ELSE 0 END) as correct,
+                    SUM(CASE WHEN user_feedback = 'incorrect' THEN 1 ELSE 0 END) as incorrect
+                FROM manager_decisions 
+                WHERE created_at > datetime('now', '-7 days')
+            """)
+            stats = cursor.fetchone()
+        return stats
+    
     def log_interaction(self, agent_id, session_id, interaction_type, direction, content, metadata=None):
         """Log an interaction between manager and agent."""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("""
-            INSERT INTO interaction_logs 
-            (agent_id, session_id, interaction_type, direction, content, metadata)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (agent_id, session_id, interaction_type, direction, content, 
-              json.dumps(metadata) if metadata else None))
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(
+                _INSERT_INTERACTION_SQL,
+                (agent_id, session_id, interaction_type, direction, content,
+                 _json_dumps(metadata) if metadata else None)
+            )
     
-    def get_agent_logs(self, agent_id=None, session_id=None, limit=None, interaction_type=None):
-        """Get interaction logs for an agent or session."""
-        conn = sqlite3.connect(self.db_path)
-        
-        # Build query with filters
+    def log_interactions_bulk(self, rows):
+        """Log interaction rows (matching _INSERT_INTERACTION_SQL) in one transaction."""
+        with self._transaction():
+            self._conn.executemany(_INSERT_INTERACTION_SQL, rows)
+    
+    def _agent_logs_query(self, agent_id=None, session_id=None, limit=None, interaction_type=None):
+        """Build the interaction log query and parameters for the given filters."""
         query = """
             SELECT il.id, il.agent_id, a.task_description, il.session_id, 
                    il.interaction_type, il.direction, il.content, il.metadata, il.timestamp
@@ -1081,44 +1547,80 @@ This agent is running under manager supervision:
             query += " AND il.interaction_type = ?"
             params.append(interaction_type)
         
-        query += " ORDER BY il.timestamp ASC"
-        
-        if limit:
-            query += " LIMIT ?"
-            params.append(limit)
-        
-        cursor = conn.execute(query, params)
-        logs = cursor.fetchall()
-        conn.close()
+        # LIMIT -1 means no limit, keeping the SQL text (and cached statement) the same
+        query += " ORDER BY il.timestamp ASC LIMIT ?"
+        params.append(limit or -1)
+        return query, params
+    
+    def get_agent_logs(self, agent_id=None, session_id=None, limit=None, interaction_type=None):
+        """Get interaction logs for an agent or session."""
+        query, params = self._agent_logs_query(agent_id, session_id, limit, interaction_type)
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+            logs = cursor.fetchall()
         return logs
     
+    def iter_agent_logs(self, agent_id=None, session_id=None, interaction_type=None):
+        """Yield interaction logs in batches instead of loading them all at once."""
+        query, params = self._agent_logs_query(agent_id, session_id, None, interaction_type)
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+            cursor.arraysize = 256
+        while True:
+            # Only hold the lock while stepping the cursor, not while the caller works
+            with self._lock:
+                batch = cursor.fetchmany()
+            if not batch:
+                break
+            yield from batch
+    
     def get_agent_sessions(self, agent_id):
         """Get all session IDs for an agent."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute("""
-            SELECT DISTINCT session_id, MIN(timestamp) as start_time, MAX(timestamp) as end_time,
-                   COUNT(*) as interaction_count
-            FROM interaction_logs 
-            WHERE agent_id = ?
-            GROUP BY session_id
-            ORDER BY start_time DESC
-        """, (agent_id,))
-        sessions = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.execute("""
+                SELECT DISTINCT session_id, MIN(timestamp) as start_time, MAX(timestamp) as end_time,
+                       COUNT(*) as interaction_count
+                FROM interaction_logs 
+                WHERE agent_id = ?
+                GROUP BY session_id
+                ORDER BY start_time DESC
+            """, (agent_id,))
+            sessions = cursor.fetchall()
         return sessions
     
+    def get_agents_with_logs(self):
+        """Get agents that have interaction logs, most recently active first."""
+        with self._lock:
+            cursor = self._conn.execute("""
+                SELECT il.agent_id, a.task_description, COUNT(*) as log_count,
+                       MIN(il.timestamp) as first_log, MAX(il.timestamp) as last_log
+                FROM interaction_logs il
+                JOIN agents a ON il.agent_id = a.id
+                GROUP BY il.agent_id, a.task_description
+                ORDER BY last_log DESC
+            """)
+            agents = cursor.fetchall()
+        return agents
+    
     def search_logs(self, search_term, agent_id=None, limit=50):
         """Search interaction logs by content."""
-        conn = sqlite3.connect(self.db_path)
-        
         query = """
             SELECT il.id, il.agent_id, a.task_description, il.session_id, 
                    il.interaction_type, il.direction, il.content, il.metadata, il.timestamp
             FROM interaction_logs il
             JOIN agents a ON il.agent_id = a.id
-            WHERE il.content LIKE ?
         """
-        params = [f"%{search_term}%"]
+        # Trigrams match any substring of 3+ characters, case-insensitively like LIKE
+        if self._has_fts and len(search_term) >= 3:
+            query += """
+            WHERE il.id IN (
+                SELECT rowid FROM interaction_logs_fts WHERE interaction_logs_fts MATCH ?
+            )
+            """
+            params = ['"' + search_term.replace('"', '""') + '"']
+        else:
+            query += " WHERE il.content LIKE ?"
+            params = [f"%{search_term}%"]
         
         if agent_id:
             query += " AND il.agent_id = ?"
@@ -1127,18 +1629,16 @@ This agent is running under manager supervision:
         query += " ORDER BY il.timestamp DESC LIMIT ?"
         params.append(limit)
         
-        cursor = conn.execute(query, params)
-        logs = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+            logs = cursor.fetchall()
         return logs
     
     def export_logs(self, agent_id, format="json"):
         """Export all logs for an agent in specified format."""
-        logs = self.get_agent_logs(agent_id)
-        
         if format == "json":
             log_data = []
-            for log in logs:
+            for log in self.iter_agent_logs(agent_id):
                 log_entry = {
                     "id": log[0],
                     "agent_id": log[1],
@@ -1154,129 +1654,100 @@ This agent is running under manager supervision:
             return json.dumps(log_data, indent=2)
         
         elif format == "text":
-            lines = []
-            current_session = None
-            
-            for log in logs:
-                log_id, agent_id, task_desc, session_id, interaction_type, direction, content, metadata, timestamp = log
-                
-                if session_id != current_session:
-                    lines.append(f"\n=== SESSION {session_id} ===")
-                    lines.append(f"Task: {task_desc}")
-                    lines.append("")
-                    current_session = session_id
-                
-                # Format timestamp
-                ts = timestamp.split('.')[0] if '.' in timestamp else timestamp
-                
-                # Format direction indicator
-                if direction == "agent_to_manager":
-                    indicator = "🤖→🧠"
-                elif direction == "manager_to_agent":
-                    indicator = "🧠→🤖"
-                else:
-                    indicator = "⚙️"
-                
-                lines.append(f"[{ts}] {indicator} {interaction_type.upper()}")
-                
-                # Format content with indentation
-                content_lines = content.split('\n')
-                for line in content_lines:
-                    lines.append(f"    {line}")
-                
-                # Add metadata if present
-                if metadata:
-                    meta_data = json.loads(metadata)
-                    lines.append(f"    📋 {json.dumps(meta_data, separators=(',', ':'))}")
-                
-                lines.append("")
-            
-            return '\n'.join(lines)
+            return '\n'.join(self.iter_text_export(agent_id))
         
         else:
             raise ValueError(f"Unsupported format: {format}")
     
-    def simulate_agent_interaction(self, agent_id, session_id, tool_requests):
+    def iter_text_export(self, agent_id):
+        """Yield the text export of an agent's logs one line at a time."""
+        current_session = None
+        
+        for log in self.iter_agent_logs(agent_id):
+            log_id, agent_id, task_desc, session_id, interaction_type, direction, content, metadata, timestamp = log
+            
+            if session_id != current_session:
+                yield f"\n=== SESSION {session_id} ==="
+                yield f"Task: {task_desc}"
+                yield ""
+                current_session = session_id
+            
+            # Format timestamp
+            ts = timestamp.split('.')[0] if '.' in timestamp else timestamp
+            
+            # Format direction indicator
+            indicator = _DIRECTION_INDICATOR.get(direction, "⚙️")
+            
+            yield f"[{ts}] {indicator} {interaction_type.upper()}"
+            
+            # Format content with indentation
+            for line in content.split('\n'):
+                yield f"    {line}"
+            
+            # Add metadata if present
+            if metadata:
+                # Rows logged before metadata was stored compactly use the default separators
+                yield f"    📋 {_json_dumps(json.loads(metadata))}"
+            
+            yield ""
+    
+    def simulate_agent_interaction(self, agent_id, session_id, tool_requests, delay=0.0):
         """Simulate a series of agent interactions for testing/demo purposes."""
+        def log(interaction_type, direction, content, metadata):
+            rows.append((agent_id, session_id, interaction_type, direction,
+                         content, _json_dumps(metadata)))
+        
         for i, request in enumerate(tool_requests):
+            tool = request.get("tool")
+            request_json = json.dumps(request, indent=2)
+            rows = []
+            
             # Log agent request
-            self.log_interaction(
-                agent_id=agent_id,
-                session_id=session_id,
-                interaction_type="agent_request",
-                direction="agent_to_manager",
-                content=json.dumps(request, indent=2),
-                metadata={
-                    "tool": request.get("tool"),
-                    "sequence": i + 1,
-                    "total_requests": len(tool_requests)
-                }
-            )
+            log("agent_request", "agent_to_manager", request_json, {
+                "tool": tool,
+                "sequence": i + 1,
+                "total_requests": len(tool_requests)
+            })
             
             # Simulate manager evaluation
-            risk_score = self._assess_risk(request)
+            risk_score = self._assess_risk(request, request_json)
             confidence_score = self.calculate_confidence_score()
-            should_escalate = self.should_escalate(request, confidence_score)
+            should_escalate = self.should_escalate(request, confidence_score, request_json)
             
             decision = "escalate" if should_escalate else "approve"
             
             # Log manager response
-            self.log_interaction(
-                agent_id=agent_id,
-                session_id=session_id,
-                interaction_type="manager_response",
-                direction="manager_to_agent",
-                content=f"Decision: {decision.upper()}",
-                metadata={
-                    "confidence_score": confidence_score,
-                    "risk_score": risk_score,
-                    "autonomy_level": self.get_autonomy_level(),
-                    "reasoning": f"Risk: {risk_score:.2f}, Confidence: {confidence_score:.2f}"
-                }
-            )
+            log("manager_response", "manager_to_agent", f"Decision: {decision.upper()}", {
+                "confidence_score": confidence_score,
+                "risk_score": risk_score,
+                "autonomy_level": self.get_autonomy_level(),
+                "reasoning": f"Risk: {risk_score:.2f}, Confidence: {confidence_score:.2f}"
+            })
             
             # Log agent response to decision
             if decision == "approve":
-                self.log_interaction(
-                    agent_id=agent_id,
-                    session_id=session_id,
-                    interaction_type="agent_output",
-                    direction="agent_to_manager",
-                    content=f"Executing {request.get('tool')} operation...",
-                    metadata={
-                        "operation": request.get("tool"),
-                        "status": "executing"
-                    }
-                )
+                log("agent_output", "agent_to_manager", f"Executing {tool} operation...", {
+                    "operation": tool,
+                    "status": "executing"
+                })
                 
-                # Simulate completion
-                import time
-                time.sleep(0.1)  # Small delay for realistic timestamps
+                # Simulate completion (demos can opt into a pause)
+                if delay:
+                    time.sleep(delay)
                 
-                self.log_interaction(
-                    agent_id=agent_id,
-                    session_id=session_id,
-                    interaction_type="agent_output",
-                    direction="agent_to_manager", 
-                    content=f"✅ {request.get('tool')} operation completed successfully",
-                    metadata={
-                        "operation": request.get("tool"),
-                        "status": "completed",
-                        "result": "success"
-                    }
-                )
+                log("agent_output", "agent_to_manager", f"✅ {tool} operation completed successfully", {
+                    "operation": tool,
+                    "status": "completed",
+                    "result": "success"
+                })
             else:
-                self.log_interaction(
-                    agent_id=agent_id,
-                    session_id=session_id,
-                    interaction_type="agent_output",
-                    direction="agent_to_manager",
-                    content=f"⏸️ Waiting for user approval for {request.get('tool')} operation",
-                    metadata={
-                        "operation": request.get("tool"),
-                        "status": "waiting_approval"
-                    }
-                )
+                log("agent_output", "agent_to_manager", f"⏸️ Waiting for user approval for {tool} operation", {
+                    "operation": tool,
+                    "status": "waiting_approval"
+                })
+            
+            # One commit per simulated request
+            self.log_interactions_bulk(rows)
 
 
 def get_manager_daemon():
@@ -1286,6 +1757,8 @@ def get_manager_daemon():
 
 def is_manager_running():
     """Check if manager daemon is running."""
+    import socket
+
     try:
         sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         sock.connect("/tmp/mcl_manager.sock")
@@ -1297,13 +1770,17 @@ def is_manager_running():
 
 def send_manager_command(command, **kwargs):
     """Send command to running manager daemon."""
-    if not is_manager_running():
-        print("❌ Manager daemon not running. Start with: mcl manager start")
-        return False
-    
+    import socket
+
     try:
         sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        sock.connect("/tmp/mcl_manager.sock")
+        # Connecting doubles as the liveness check; no separate probe socket
+        try:
+            sock.connect("/tmp/mcl_manager.sock")
+        except (ConnectionRefusedError, FileNotFoundError):
+            sock.close()
+            print("❌ Manager daemon not running. Start with: mcl manager start")
+            return False
         
         message = {
             'command': command,
@@ -1326,7 +1803,6 @@ def cmd_manager(args):
     """Handle manager subcommands."""
     if not hasattr(args, 'manager_command') or args.manager_command is None:
         # No subcommand provided, show help
-        import argparse
         parser = argparse.ArgumentParser(prog="mcl manager", description="Manage multiple Claude Code agents [EXPERIMENTAL]")
         subparsers = parser.add_subparsers(dest="manager_command", help="Manager commands")
         
@@ -1367,13 +1843,7 @@ def cmd_manager(args):
         repo_path = args.repo
         priority = getattr(args, 'priority', 'normal')
         
-        if not is_manager_running():
-            # Auto-start manager if not running
-            print("🚀 Starting manager daemon...")
-            daemon = get_manager_daemon()
-        else:
-            daemon = get_manager_daemon()
-        
+        daemon = get_manager_daemon()
         agent_id, session_id = daemon.spawn_agent(task_description, repo_path, priority)
         print(f"🤖 Task queued with agent {agent_id}")
         
@@ -1413,12 +1883,9 @@ def cmd_manager(args):
             print(f"{queue_id} | {agent_id} | {req_type} | {created_at}")
             
     elif args.manager_command == "stop":
-        if not is_manager_running():
-            print("ℹ️  Manager daemon not running")
-            return
-        
-        send_manager_command("stop")
-        print("🛑 Manager daemon stopped")
+        # send_manager_command reports a daemon that is not running itself
+        if send_manager_command("stop"):
+            print("🛑 Manager daemon stopped")
     
     elif args.manager_command == "config":
         daemon = get_manager_daemon()
@@ -1471,19 +1938,7 @@ def cmd_manager(args):
         model = daemon.get_evaluation_model()
         
         # Get recent decision stats
-        conn = sqlite3.connect(daemon.db_path)
-        cursor = conn.execute("""
-            SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN decision = 'approve' THEN 1 ELSE 0 END) as approved,
-                SUM(CASE WHEN decision = 'escalate' THEN 1 ELSE 0 END) as escalated,
-                SUM(CASE WHEN user_feedback = 'correct' THEN 1 ELSE 0 END) as correct,
-                SUM(CASE WHEN user_feedback = 'incorrect' THEN 1 ELSE 0 END) as incorrect
-            FROM manager_decisions 
-            WHERE created_at > datetime('now', '-7 days')
-        """)
-        stats = cursor.fetchone()
-        conn.close()
+        stats = daemon.get_stats()
         
         if stats:
             total, approved, escalated, correct, incorrect = stats
@@ -1534,7 +1989,9 @@ def cmd_manager(args):
             if format_type == 'json':
                 print(daemon.export_logs(args.agent_id, format='json'))
             else:
-                print(daemon.export_logs(args.agent_id, format='text'))
+                sys.stdout.writelines(
+                    f"{line}\n" for line in daemon.iter_text_export(args.agent_id)
+                )
         
         elif hasattr(args, 'search') and args.search:
             # Search logs by content
@@ -1555,16 +2012,11 @@ def cmd_manager(args):
                 ts = timestamp.split('.')[0] if '.' in timestamp else timestamp
                 
                 # Direction indicator
-                if direction == "agent_to_manager":
-                    indicator = "🤖→🧠"
-                elif direction == "manager_to_agent": 
-                    indicator = "🧠→🤖"
-                else:
-                    indicator = "⚙️"
+                indicator = _DIRECTION_INDICATOR.get(direction, "⚙️")
                 
                 print(f"[{ts}] {indicator} {agent_id} | {interaction_type}")
                 # Show first line of content
-                first_line = content.split('\n')[0][:80]
+                first_line = content.partition('\n')[0][:80]
                 if len(first_line) == 80:
                     first_line += "..."
                 print(f"    {first_line}")
@@ -1572,17 +2024,7 @@ def cmd_manager(args):
         
         else:
             # List all agents with log activity
-            conn = sqlite3.connect(daemon.db_path)
-            cursor = conn.execute("""
-                SELECT il.agent_id, a.task_description, COUNT(*) as log_count,
-                       MIN(il.timestamp) as first_log, MAX(il.timestamp) as last_log
-                FROM interaction_logs il
-                JOIN agents a ON il.agent_id = a.id
-                GROUP BY il.agent_id, a.task_description
-                ORDER BY last_log DESC
-            """)
-            agents_with_logs = cursor.fetchall()
-            conn.close()
+            agents_with_logs = daemon.get_agents_with_logs()
             
             if not agents_with_logs:
                 print("📭 No interaction logs found")
@@ -1607,7 +2049,6 @@ def cmd_manager(args):
         
         if not hasattr(args, 'agent_id') or not args.agent_id:
             # Show help for sessions command
-            import argparse
             parser = argparse.ArgumentParser(prog="mcl manager sessions", description="List sessions for an agent")
             parser.add_argument("--agent", dest="agent_id", required=True, help="Agent ID to list sessions for")
             parser.print_help()
@@ -1619,14 +2060,15 @@ def cmd_manager(args):
             print(f"📭 No sessions found for agent {args.agent_id}")
             return
         
-        print(f"📅 SESSIONS FOR AGENT {args.agent_id}:")
-        print("-" * 70)
+        # Build the listing first and write it with a single print
+        lines = [f"📅 SESSIONS FOR AGENT {args.agent_id}:", "-" * 70]
         for session_id, start_time, end_time, interaction_count in sessions:
             start_ts = start_time.split('.')[0] if '.' in start_time else start_time
             end_ts = end_time.split('.')[0] if '.' in end_time else end_time
-            print(f"{session_id} | {start_ts} → {end_ts} | {interaction_count} interactions")
+            lines.append(f"{session_id} | {start_ts} → {end_ts} | {interaction_count} interactions")
         
-        print(f"\nUse: mcl manager log --agent {args.agent_id} --session <session_id> to view session logs")
+        lines.append(f"\nUse: mcl manager log --agent {args.agent_id} --session <session_id> to view session logs")
+        print("\n".join(lines))
     
     elif args.manager_command == "simulate":
         # Demo/testing command to simulate agent interactions
@@ -1634,9 +2076,9 @@ def cmd_manager(args):
         
         if not hasattr(args, 'agent_id') or not args.agent_id:
             # Show help for simulate command
-            import argparse
             parser = argparse.ArgumentParser(prog="mcl manager simulate", description="Simulate agent interactions for testing")
             parser.add_argument("--agent", dest="agent_id", required=True, help="Agent ID to simulate interactions for")
+            parser.add_argument("--delay", type=float, default=0.0, help="Seconds to pause after each approved request")
             parser.print_help()
             return
         
@@ -1652,7 +2094,9 @@ def cmd_manager(args):
         session_id = f"sim_session_{int(time.time())}"
         
         print(f"🎭 Simulating agent interactions for {args.agent_id}...")
-        daemon.simulate_agent_interaction(args.agent_id, session_id, tool_requests)
+        daemon.simulate_agent_interaction(
+            args.agent_id, session_id, tool_requests, delay=getattr(args, 'delay', 0.0)
+        )
         print(f"✅ Simulation complete. View logs with: mcl manager log --agent {args.agent_id}")
         
     else:
@@ -1664,38 +2108,29 @@ def cmd_start(args):
     # Determine if we're working with a local repo or URL
     is_local = is_local_path(args.repo)
 
-    # Determine workspace directory
-    if is_local:
-        # For local repos, use staging directory (unless workspace explicitly overrides)
-        if args.workspace:
-            workspace_path = Path(args.workspace).resolve()
-        else:
-            # Default to ~/.mcl/staging directory
-            home_dir = Path.home()
-            default_staging = home_dir / ".mcl" / "staging"
-            staging_dir = args.staging_dir or str(default_staging)
-
-            workspace_path = Path(staging_dir).resolve()
-            workspace_path.mkdir(parents=True, exist_ok=True)
+    # Determine workspace directory: explicit override, else the staging directory
+    if args.workspace:
+        workspace_path = Path(args.workspace).resolve()
     else:
-        # For URLs, use staging directory by default
-        if args.workspace:
-            workspace_path = Path(args.workspace).resolve()
-        else:
-            # Default to ~/.mcl/staging directory
-            home_dir = Path.home()
-            default_staging = home_dir / ".mcl" / "staging"
-            staging_dir = args.staging_dir or str(default_staging)
-
-            workspace_path = Path(staging_dir).resolve()
+        # Default to ~/.mcl/staging directory
+        workspace_path = Path(args.staging_dir or _DEFAULT_STAGING).resolve()
+        # A single stat once the directory exists, instead of mkdir's EEXIST + stat
+        if not workspace_path.is_dir():
             workspace_path.mkdir(parents=True, exist_ok=True)
 
     # Process requirements first (needed for feature naming)
+    background_clone = None
     if is_github_issue_url(args.requirements):
+        # A fresh URL clone doesn't depend on the issue, so overlap the two and
+        # rename the clone once the feature directory name is known
+        if not is_local and not args.no_clone and not args.continue_branch:
+            background_clone = clone_in_background(args.repo, workspace_path)
         print(f"Fetching GitHub issue: {args.requirements}")
-        requirements = fetch_github_issue(args.requirements)
+        requirements = fetch_github_issue(args.requirements, refresh=args.refresh)
         if not requirements:
             print("Failed to fetch GitHub issue")
+            if background_clone:
+                cancel_background_clone(background_clone)
             sys.exit(1)
     elif is_requirements_file(args.requirements):
         print(f"Reading requirements from file: {args.requirements}")
@@ -1707,8 +2142,11 @@ def cmd_start(args):
         requirements = args.requirements
 
     # Get repository name with feature summary and determine unique path
-    repo_name = get_repo_name(args.repo)
-    feature_repo_name = get_feature_repo_name(args.repo, requirements)
+    # is_local was computed above; avoid re-probing the filesystem
+    repo_name = get_repo_name(args.repo, is_local=is_local)
+    feature_repo_name = get_feature_repo_name(
+        args.repo, requirements, repo_name=repo_name
+    )
     base_repo_path = workspace_path / feature_repo_name
     repo_path = (
         get_unique_repo_path(base_repo_path)
@@ -1727,68 +2165,74 @@ def cmd_start(args):
         branch_name = args.branch
     else:
         # Create branch name from requirements (first few words, sanitized)
-        words = re.sub(r"[^\w\s]", "", requirements.split("\n")[0]).split()[:3]
+        words = strip_punctuation(requirements.partition("\n")[0]).split()[:3]
         branch_name = "feature/" + "-".join(words).lower()
 
     print(f"Using branch: {branch_name}")
 
-    # Handle repository cloning/copying
+    # Handle repository cloning/copying (stat repo_path once up front)
+    repo_exists = repo_path.exists()
     if not args.no_clone:
         if is_local:
             print("Copying local repository...")
-            if repo_path.exists():
+            if repo_exists:
                 if args.continue_branch:
                     print(f"Directory {repo_path} exists, using existing repository")
                 else:
                     print(f"Directory {repo_path} already exists. Will overwrite...")
 
-            if not args.continue_branch or not repo_path.exists():
-                copy_success = copy_local_repo(
-                    Path(args.repo).resolve(), repo_path, branch_name
-                )
+            if not args.continue_branch or not repo_exists:
+                # Absolute paths work as-is; only relative ones need realpath's lstat walk
+                source_path = Path(args.repo)
+                if not source_path.is_absolute():
+                    source_path = source_path.resolve()
+                copy_success = copy_local_repo(source_path, repo_path, branch_name)
                 if not copy_success:
                     print("Failed to copy local repository")
                     sys.exit(1)
         else:
             print("Cloning repository...")
-            if repo_path.exists():
+            if repo_exists:
                 if args.continue_branch:
                     print(f"Directory {repo_path} exists, using existing repository")
                 else:
                     # repo_path should already be unique from get_unique_repo_path above
                     print(f"Using unique directory path: {repo_path}")
 
-            if not repo_path.exists():
-                # Extract just the directory name for the clone command
-                clone_dir_name = repo_path.name
-                clone_result = run_command(
-                    f"git clone {args.repo} {clone_dir_name}", cwd=workspace_path
-                )
-                if clone_result is None:
+            if not repo_exists:
+                if background_clone:
+                    cloned = finish_background_clone(background_clone, repo_path)
+                else:
+                    # Extract just the directory name for the clone command
+                    clone_dir_name = repo_path.name
+                    cloned = run_command(
+                        _url_clone_command(args.repo, clone_dir_name),
+                        cwd=workspace_path,
+                    ) is not None
+                if not cloned:
                     print("Failed to clone repository")
                     sys.exit(1)
     else:
-        if not repo_path.exists():
+        if not repo_exists:
             print(
                 f"Repository path {repo_path} does not exist and --no-clone specified"
             )
             sys.exit(1)
 
     # Handle branch creation/checkout (skip if worktree already created the branch)
-    current_branch_result = run_command("git branch --show-current", cwd=repo_path)
-    current_branch = current_branch_result.strip() if current_branch_result else ""
-
     # Only handle branch operations if we're not already on the target branch
     # (worktrees automatically create and checkout the branch)
-    if current_branch != branch_name:
+    if current_branch(repo_path) != branch_name:
         if args.continue_branch:
             print(f"Checking out existing branch '{branch_name}'...")
             # Try to checkout existing branch, create if it doesn't exist
-            checkout_result = run_command(f"git checkout {branch_name}", cwd=repo_path)
+            checkout_result = run_command(
+                ["git", "checkout", branch_name], cwd=repo_path
+            )
             if checkout_result is None:
                 print(f"Branch '{branch_name}' not found, creating new branch...")
                 checkout_result = run_command(
-                    f"git checkout -b {branch_name}", cwd=repo_path
+                    ["git", "checkout", "-b", branch_name], cwd=repo_path
                 )
                 if checkout_result is None:
                     print("Failed to create branch")
@@ -1796,7 +2240,7 @@ def cmd_start(args):
         else:
             print(f"Creating new branch '{branch_name}'...")
             checkout_result = run_command(
-                f"git checkout -b {branch_name}", cwd=repo_path
+                ["git", "checkout", "-b", branch_name], cwd=repo_path
             )
             if checkout_result is None:
                 print("Failed to create branch")
@@ -1805,11 +2249,11 @@ def cmd_start(args):
         print(f"Already on branch '{branch_name}'")
 
     # Create or update TASK_MEMORY.md
-    memory_file = os.path.join(repo_path, "TASK_MEMORY.md")
-    if args.continue_branch and os.path.exists(memory_file):
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    memory_file = repo_path / "TASK_MEMORY.md"
+    if args.continue_branch and memory_file.exists():
         print("TASK_MEMORY.md exists, updating with new session...")
         # Append new session info to existing file
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         additional_content = f"\n\n## New Session - {timestamp}\n\n"
         if args.instructions:
             additional_content += (
@@ -1818,49 +2262,49 @@ def cmd_start(args):
         additional_content += f"**Requirements (refresher):**\n{requirements}\n\n"
         additional_content += f"- [{timestamp}] Resumed work on existing branch\n"
 
-        with open(memory_file, "a") as f:
-            f.write(additional_content)
+        _write_file(memory_file, additional_content, append=True)
     else:
         print("Creating TASK_MEMORY.md...")
-        memory_file = create_task_memory(requirements, repo_path, branch_name)
+        memory_file = create_task_memory(
+            requirements, repo_path, branch_name, timestamp=timestamp
+        )
 
     # Note: TASK_MEMORY.md is excluded from git via .gitignore to keep task notes local
     print("TASK_MEMORY.md created (not committed - kept as local task notes)")
 
-    print("\n" + "=" * 50)
-    print("SETUP COMPLETE!")
-    print("=" * 50)
-    print(f"Repository cloned to: {repo_path}")
-    print(f"Branch created: {branch_name}")
-    print(f"Task memory file: {memory_file}")
+    print(
+        "\n" + "=" * 50,
+        "SETUP COMPLETE!",
+        "=" * 50,
+        f"Repository cloned to: {repo_path}",
+        f"Branch created: {branch_name}",
+        f"Task memory file: {memory_file}",
+        sep="\n",
+    )
 
     if not args.no_claude:
         print("\nStarting Claude Code with initial prompt...")
 
         # Create initial prompt for Claude
         if args.continue_branch:
-            initial_prompt = f"""I'm continuing work on an existing task. Here's the current state:
+            parts = [f"""I'm continuing work on an existing task. Here's the current state:
 
 **Repository:** {repo_name}
 **Branch:** {branch_name} (existing branch)
 **Task Memory:** TASK_MEMORY.md (contains previous work and notes)
 
-Please start by reading the TASK_MEMORY.md file to understand the requirements and previous work done. The file has been updated with this new session."""
+Please start by reading the TASK_MEMORY.md file to understand the requirements and previous work done. The file has been updated with this new session."""]
 
             if args.instructions:
-                initial_prompt += f"""
-
-**Current Instructions:** 
-{args.instructions}"""
+                parts.append(f"""**Current Instructions:** 
+{args.instructions}""")
 
-            initial_prompt += f"""
-
-**Requirements (refresher):**
+            parts.append(f"""**Requirements (refresher):**
 {requirements}
 
-Please review the current state and continue working on the task!"""
+Please review the current state and continue working on the task!""")
         else:
-            initial_prompt = f"""I've set up a new task workspace for you. Here's what's been prepared:
+            parts = [f"""I've set up a new task workspace for you. Here's what's been prepared:
 
 **Repository:** {repo_name}
 **Branch:** {branch_name} (new branch)
@@ -1873,20 +2317,19 @@ Please review the current state and continue working on the task!"""
    - Activate it: `source venv/bin/activate` (Linux/Mac) or `venv\\Scripts\\activate` (Windows)
    - Install dependencies: `pip install -r requirements.txt` (if requirements.txt exists)
 
-Please start by reading the TASK_MEMORY.md file to understand the requirements, then set up the development environment as needed, and begin working on the task. Remember to update TASK_MEMORY.md with your progress, decisions, and notes as you work."""
+Please start by reading the TASK_MEMORY.md file to understand the requirements, then set up the development environment as needed, and begin working on the task. Remember to update TASK_MEMORY.md with your progress, decisions, and notes as you work."""]
 
             if args.instructions:
-                initial_prompt += f"""
-
-**Additional Instructions:** 
-{args.instructions}"""
-
-            initial_prompt += f"""
+                parts.append(f"""**Additional Instructions:** 
+{args.instructions}""")
 
-**Requirements:**
+            parts.append(f"""**Requirements:**
 {requirements}
 
-Let's get started!"""
+Let's get started!""")
+
+        # Prompt sections are separated by a blank line
+        initial_prompt = "\n\n".join(parts)
 
         # Change to the repo directory and start Claude Code
         os.chdir(repo_path)
@@ -1924,70 +2367,8 @@ def cmd_cd(args):
     handle_cd_command(args.staging_dir, args.number)
 
 
-def main():
-    """Main CLI entry point with subcommands."""
-    parser = argparse.ArgumentParser(
-        prog="mcl",
-        description="Multi-Claude task management - work on multiple features simultaneously",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  mcl start --repo https://github.com/user/repo --requirements "Add auth"
-  mcl --repo https://github.com/user/repo --requirements "Add auth"  # (backwards compatible)
-  mcl ls
-  eval "$(mcl cd 1)"    # Change to task 1 (manual method)
-  mcl shell-init
-
-For shell integration, add this to your ~/.bashrc or ~/.zshrc:
-  eval "$(mcl shell-init)"
-  
-Then use:
-  mcl_cd        # List tasks
-  mcl_cd 1      # Change to task 1 (recommended)
-        """,
-    )
-
-    # Add backwards compatibility arguments to main parser
-    parser.add_argument(
-        "-r", "--repo", help="Repository URL to clone or local directory path"
-    )
-    parser.add_argument(
-        "-rq",
-        "--requirements",
-        help="Requirements text, GitHub issue URL, or file path",
-    )
-    parser.add_argument(
-        "-b", "--branch", help="Branch name (auto-generated if not provided)"
-    )
-    parser.add_argument("-w", "--workspace", help="Workspace directory")
-    parser.add_argument(
-        "-s", "--staging-dir", help="Staging directory (default: ~/.mcl/staging)"
-    )
-    parser.add_argument(
-        "-i", "--instructions", help="Additional instructions for Claude Code"
-    )
-    parser.add_argument(
-        "-c",
-        "--continue-branch",
-        action="store_true",
-        help="Continue work on existing branch instead of creating new one",
-    )
-    parser.add_argument(
-        "-nc",
-        "--no-clone",
-        action="store_true",
-        help="Skip cloning (repo already exists)",
-    )
-    parser.add_argument(
-        "-nd",
-        "--no-claude",
-        action="store_true",
-        help="Skip starting Claude Code after setup",
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # Start subcommand
+def _add_start_parser(subparsers):
+    """Add the start subcommand."""
     start_parser = subparsers.add_parser("start", help="Start a new task workspace")
     start_parser.add_argument(
         "--repo", required=True, help="Repository URL to clone or local directory path"
@@ -2018,16 +2399,25 @@ Then use:
     start_parser.add_argument(
         "--no-claude", action="store_true", help="Skip starting Claude Code after setup"
     )
+    start_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-fetch a GitHub issue even if a cached copy is fresh",
+    )
     start_parser.set_defaults(func=cmd_start)
 
-    # ls subcommand (primary)
+
+def _add_ls_parser(subparsers):
+    """Add the ls subcommand."""
     ls_parser = subparsers.add_parser("ls", help="List all staged tasks")
     ls_parser.add_argument(
         "--staging-dir", help="Staging directory (default: ~/.mcl/staging)"
     )
     ls_parser.set_defaults(func=cmd_list)
 
-    # list alias for backwards compatibility
+
+def _add_list_parser(subparsers):
+    """Add the list alias for ls."""
     list_parser = subparsers.add_parser(
         "list", help="List all staged tasks (backwards compatibility alias for ls)"
     )
@@ -2036,13 +2426,17 @@ Then use:
     )
     list_parser.set_defaults(func=cmd_list)
 
-    # Shell-init subcommand
+
+def _add_shell_init_parser(subparsers):
+    """Add the shell-init subcommand."""
     shell_parser = subparsers.add_parser(
         "shell-init", help="Output shell integration code for bash/zsh"
     )
     shell_parser.set_defaults(func=cmd_shell_init)
 
-    # CD subcommand (for shell integration)
+
+def _add_cd_parser(subparsers):
+    """Add the cd subcommand."""
     cd_parser = subparsers.add_parser(
         "cd", help="Output shell command to change directory to task N"
     )
@@ -2052,7 +2446,9 @@ Then use:
     )
     cd_parser.set_defaults(func=cmd_cd)
 
-    # Manager subcommand
+
+def _add_manager_parser(subparsers):
+    """Add the manager subcommand and its own subcommands."""
     manager_parser = subparsers.add_parser("manager", help="Manage multiple Claude Code agents [EXPERIMENTAL]")
     manager_parser.set_defaults(func=cmd_manager)
     manager_subparsers = manager_parser.add_subparsers(dest="manager_command", help="Manager commands")
@@ -2130,8 +2526,101 @@ Then use:
     # manager simulate (for testing/demo)
     manager_simulate_parser = manager_subparsers.add_parser("simulate", help="Simulate agent interactions for testing")
     manager_simulate_parser.add_argument("--agent", dest="agent_id", help="Agent ID to simulate interactions for")
+    manager_simulate_parser.add_argument("--delay", type=float, default=0.0, help="Seconds to pause after each approved request")
     manager_simulate_parser.set_defaults(func=cmd_manager)
 
+
+# Subcommand name -> function that adds its parser, so main() only builds the one in use
+_SUBCOMMAND_PARSERS = {
+    "start": _add_start_parser,
+    "ls": _add_ls_parser,
+    "list": _add_list_parser,
+    "shell-init": _add_shell_init_parser,
+    "cd": _add_cd_parser,
+    "manager": _add_manager_parser,
+}
+
+
+def main():
+    """Main CLI entry point with subcommands."""
+    parser = argparse.ArgumentParser(
+        prog="mcl",
+        description="Multi-Claude task management - work on multiple features simultaneously",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  mcl start --repo https://github.com/user/repo --requirements "Add auth"
+  mcl --repo https://github.com/user/repo --requirements "Add auth"  # (backwards compatible)
+  mcl ls
+  eval "$(mcl cd 1)"    # Change to task 1 (manual method)
+  mcl shell-init
+
+For shell integration, add this to your ~/.bashrc or ~/.zshrc:
+  eval "$(mcl shell-init)"
+  
+Then use:
+  mcl_cd        # List tasks
+  mcl_cd 1      # Change to task 1 (recommended)
+        """,
+    )
+
+    # Add backwards compatibility arguments to main parser
+    parser.add_argument(
+        "-r", "--repo", help="Repository URL to clone or local directory path"
+    )
+    parser.add_argument(
+        "-rq",
+        "--requirements",
+        help="Requirements text, GitHub issue URL, or file path",
+    )
+    parser.add_argument(
+        "-b", "--branch", help="Branch name (auto-generated if not provided)"
+    )
+    parser.add_argument("-w", "--workspace", help="Workspace directory")
+    parser.add_argument(
+        "-s", "--staging-dir", help="Staging directory (default: ~/.mcl/staging)"
+    )
+    parser.add_argument(
+        "-i", "--instructions", help="Additional instructions for Claude Code"
+    )
+    parser.add_argument(
+        "-c",
+        "--continue-branch",
+        action="store_true",
+        help="Continue work on existing branch instead of creating new one",
+    )
+    parser.add_argument(
+        "-nc",
+        "--no-clone",
+        action="store_true",
+        help="Skip cloning (repo already exists)",
+    )
+    parser.add_argument(
+        "-nd",
+        "--no-claude",
+        action="store_true",
+        help="Skip starting Claude Code after setup",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-fetch a GitHub issue even if a cached copy is fresh",
+    )
+
+    # Find the subcommand before building any subparsers; help needs all of them
+    argv = sys.argv[1:]
+    command = None
+    if "-h" not in argv and "--help" not in argv:
+        _, rest = parser.parse_known_args(argv)
+        command = next((arg for arg in rest if not arg.startswith("-")), None)
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    if command in _SUBCOMMAND_PARSERS:
+        _SUBCOMMAND_PARSERS[command](subparsers)
+    else:
+        for add_parser in _SUBCOMMAND_PARSERS.values():
+            add_parser(subparsers)
+
     args = parser.parse_args()
 
     # Backwards compatibility: if no subcommand but --repo and --requirements are provided, assume 'start'
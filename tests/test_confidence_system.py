@@ -140,6 +140,15 @@ class TestRiskAssessment:
             risk = self.daemon._assess_risk(request)
             assert risk <= 0.2, f"Safe operation {request} should be low risk, got {risk}"
     
+    def test_assess_risk_uses_serialized_request(self):
+        """Test that a pre-serialized request is assessed instead of re-encoding."""
+        request = {"tool": "bash", "command": "RM -RF /tmp/build"}
+        request_json = json.dumps(request, indent=2)
+        
+        with patch('mcl.json.dumps') as mock_dumps:
+            assert self.daemon._assess_risk(request, request_json) == 1.0
+        mock_dumps.assert_not_called()
+    
     def test_assess_risk_dangerous_operations(self):
         """Test risk assessment for dangerous operations."""
         dangerous_requests = [
@@ -282,6 +291,17 @@ class TestDecisionTracking:
         assert decision[4] == 0.8  # confidence_score
         assert decision[6] == "gpt-4o"  # model_used
     
+    def test_get_stats(self):
+        """Test recent decision statistics."""
+        agent_id, session_id = self.daemon.spawn_agent("Test task", "/repo", "normal", 100)
+        for decision in ["approve", "approve", "escalate"]:
+            self.daemon.record_decision(agent_id, {"tool": "read"}, decision, 0.8, "gpt-4o")
+        
+        decision_id = self.daemon.get_decision_history(limit=1)[0][0]
+        self.daemon.provide_feedback(decision_id, "correct")
+        
+        assert self.daemon.get_stats() == (3, 2, 1, 1, 0)
+    
     def test_provide_feedback(self):
         """Test providing feedback on decisions."""
         agent_id, session_id = self.daemon.spawn_agent("Test task", "/repo", "normal", 100)
@@ -51,6 +51,53 @@ class TestInteractionLogging:
         
         conn.close()
     
+    def test_get_agents_with_logs(self):
+        """Test listing agents that have interaction logs."""
+        agent_id, session_id = self.daemon.spawn_agent("Test task", "/test/repo")
+        self.daemon.log_interaction(agent_id, session_id, "agent_output", "agent_to_manager", "Done")
+        
+        agents = self.daemon.get_agents_with_logs()
+        assert len(agents) == 1
+        assert agents[0][:3] == (agent_id, "Test task", 2)
+    
+    def test_search_logs_substrings(self):
+        """Test that search matches substrings, quotes and short terms like LIKE."""
+        agent_id, session_id = self.daemon.spawn_agent("Test search task", "/test/repo")
+        for content in ['Found Authentication function', 'Ran "make test"', 'ok']:
+            self.daemon.log_interaction(agent_id, session_id, "agent_output", "agent_to_manager", content)
+        
+        assert self.daemon._has_fts
+        assert [log[6] for log in self.daemon.search_logs("thenticat")] == ["Found Authentication function"]
+        assert [log[6] for log in self.daemon.search_logs('"make')] == ['Ran "make test"']
+        assert [log[6] for log in self.daemon.search_logs("ok")] == ["ok"]
+    
+    def test_search_logs_indexes_existing_rows(self):
+        """Test that logs written before the search index existed are searchable."""
+        agent_id, session_id = self.daemon.spawn_agent("Test search task", "/test/repo")
+        conn = sqlite3.connect(self.daemon.db_path)
+        conn.executescript("""
+            DROP TABLE interaction_logs_fts;
+            PRAGMA user_version = 0;
+        """)
+        conn.close()
+        
+        daemon = mcl.ManagerDaemon(self.manager_dir)
+        assert len(daemon.search_logs("spawned")) == 1
+    
+    def test_log_interactions_bulk(self):
+        """Test logging several interactions in one call."""
+        agent_id, session_id = self.daemon.spawn_agent("Test task", "/test/repo")
+        rows = [
+            (agent_id, session_id, "agent_output", "agent_to_manager", f"Step {i}", json.dumps({"step": i}))
+            for i in range(3)
+        ]
+        
+        self.daemon.log_interactions_bulk(rows)
+        
+        logs = self.daemon.get_agent_logs(agent_id=agent_id, interaction_type="agent_output")
+        assert [log[6] for log in logs] == ["Step 0", "Step 1", "Step 2"]
+        assert json.loads(logs[2][7]) == {"step": 2}
+    
     def test_log_interaction(self):
         """Test logging basic interactions."""
         # First create an agent so the JOIN works
@@ -85,6 +132,9 @@ class TestInteractionLogging:
         metadata = json.loads(test_log[7])
         assert metadata["tool"] == "read"
         assert metadata["file"] == "test.py"
+        
+        # Metadata is stored as compact JSON
+        assert test_log[7] == '{"tool":"read","file":"test.py"}'
     
     def test_get_agent_logs_filtering(self):
         """Test filtering logs by various criteria."""
@@ -118,7 +168,20 @@ class TestInteractionLogging:
         # Test no filters (all logs - should include spawn event + 4 test logs = 5)
         all_logs = self.daemon.get_agent_logs(agent_id=agent_id)
         assert len(all_logs) == 5
-    
+
+    def test_iter_agent_logs_matches_get_agent_logs(self):
+        """Test that streaming logs across several batches returns every row in order."""
+        agent_id, session_id = self.daemon.spawn_agent("Test streaming task", "/test/repo")
+        rows = [
+            (agent_id, session_id, "agent_output", "agent_to_manager", f"Step {i}", None)
+            for i in range(600)
+        ]
+        self.daemon.log_interactions_bulk(rows)
+
+        streamed = list(self.daemon.iter_agent_logs(agent_id=agent_id))
+        assert len(streamed) == 601
+        assert streamed == self.daemon.get_agent_logs(agent_id=agent_id)
+
     def test_get_agent_sessions(self):
         """Test session tracking functionality."""
         # Create an agent first
@@ -278,6 +341,16 @@ class TestInteractionLogging:
         # Check metadata formatting
         assert "📋" in text_export  # metadata indicator
     
+    def test_export_logs_text_compacts_legacy_metadata(self):
+        """Test that metadata stored with default JSON separators exports compactly."""
+        agent_id, session_id = self.daemon.spawn_agent("Test legacy export task", "/test/repo")
+        self.daemon.log_interactions_bulk([
+            (agent_id, session_id, "agent_output", "agent_to_manager", "Old row", '{"a": 1, "b": [1, 2]}')
+        ])
+        
+        text_export = self.daemon.export_logs(agent_id, format="text")
+        assert '📋 {"a":1,"b":[1,2]}' in text_export
+    
     def test_export_logs_invalid_format(self):
         """Test export with invalid format raises error."""
         # Create an agent first (even though we're testing error case)
@@ -380,32 +453,25 @@ class TestLoggingCommands:
     def test_cmd_manager_log_list_agents(self, mock_print, mock_get_daemon):
         """Test log command listing agents with logs."""
         mock_daemon = Mock()
-        mock_daemon.db_path = ":memory:"
         
         # Mock database query result
-        with patch('sqlite3.connect') as mock_connect:
-            mock_conn = Mock()
-            mock_cursor = Mock()
-            mock_cursor.fetchall.return_value = [
-                ("agent1", "Task 1", 10, "2023-07-23 10:00:00", "2023-07-23 11:00:00"),
-                ("agent2", "Task 2", 5, "2023-07-23 12:00:00", "2023-07-23 12:30:00")
-            ]
-            mock_conn.execute.return_value = mock_cursor
-            mock_connect.return_value = mock_conn
-            
-            mock_get_daemon.return_value = mock_daemon
-            
-            args = Mock()
-            args.manager_command = "log"
-            # Configure the Mock to behave like it doesn't have agent_id or search attributes
-            args.agent_id = None
-            args.search = None
-            
-            mcl.cmd_manager(args)
-            
-            # Check that agents list is displayed
-            print_calls = [call.args[0] for call in mock_print.call_args_list if call.args]
-            assert any("AGENTS WITH INTERACTION LOGS:" in call for call in print_calls)
+        mock_daemon.get_agents_with_logs.return_value = [
+            ("agent1", "Task 1", 10, "2023-07-23 10:00:00", "2023-07-23 11:00:00"),
+            ("agent2", "Task 2", 5, "2023-07-23 12:00:00", "2023-07-23 12:30:00")
+        ]
+        mock_get_daemon.return_value = mock_daemon
+        
+        args = Mock()
+        args.manager_command = "log"
+        # Configure the Mock to behave like it doesn't have agent_id or search attributes
+        args.agent_id = None
+        args.search = None
+        
+        mcl.cmd_manager(args)
+        
+        # Check that agents list is displayed
+        print_calls = [call.args[0] for call in mock_print.call_args_list if call.args]
+        assert any("AGENTS WITH INTERACTION LOGS:" in call for call in print_calls)
     
     @patch('mcl.get_manager_daemon')
     @patch('builtins.print')
@@ -472,6 +538,7 @@ class TestLoggingCommands:
         args = Mock()
         args.manager_command = "simulate"
         args.agent_id = "test_agent"
+        args.delay = 0.5
         
         mcl.cmd_manager(args)
         
@@ -480,6 +547,7 @@ class TestLoggingCommands:
         assert call_args[0][0] == "test_agent"  # agent_id
         assert "sim_session_" in call_args[0][1]  # session_id
         assert len(call_args[0][2]) == 5  # 5 sample tool requests
+        assert call_args[1]["delay"] == 0.5
     
     @patch('argparse.ArgumentParser.print_help')
     def test_cmd_manager_sessions_no_agent(self, mock_help):
@@ -52,6 +52,41 @@ class TestManagerDaemon:
         # Check database was created
         assert daemon.db_path.exists()
     
+    def test_shared_connection_uses_wal(self):
+        """Test that the daemon reuses one WAL-mode connection until closed."""
+        daemon = mcl.ManagerDaemon(self.manager_dir)
+        
+        mode = daemon._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+        
+        # Writes are visible to other connections without an explicit commit
+        daemon.set_autonomy_level("aggressive")
+        conn = sqlite3.connect(daemon.db_path)
+        row = conn.execute("SELECT value FROM manager_config WHERE key = 'autonomy_level'").fetchone()
+        conn.close()
+        assert row == ("aggressive",)
+        
+        daemon.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            daemon.get_autonomy_level()
+
+    def test_config_cache_sees_other_writers(self):
+        """Test that cached config values refresh after another connection writes."""
+        daemon = mcl.ManagerDaemon(self.manager_dir)
+        assert daemon.get_autonomy_level() == "balanced"
+
+        daemon.set_autonomy_level("conservative")
+        assert daemon.get_autonomy_level() == "conservative"
+
+        other = mcl.ManagerDaemon(self.manager_dir)
+        other.set_evaluation_model("gpt-4o")
+        other.set_autonomy_level("aggressive")
+        other.close()
+
+        assert daemon.get_autonomy_level() == "aggressive"
+        assert daemon.get_evaluation_model() == "gpt-4o"
+        daemon.close()
+
     def test_database_schema_creation(self):
         """Test that database tables are created correctly."""
         daemon = mcl.ManagerDaemon(self.manager_dir)
@@ -72,6 +107,17 @@ class TestManagerDaemon:
         for col in expected_columns:
             assert col in columns
         
+        # Check query indexes
+        cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'")
+        indexes = {row[0] for row in cursor.fetchall()}
+        assert indexes == {
+            'idx_agents_status', 'idx_queue_created', 'idx_logs_agent_ts', 'idx_logs_session_ts',
+            'idx_decisions_agent', 'idx_decisions_created', 'idx_decisions_feedback',
+        }
+        
+        # Schema version is recorded so later opens skip the DDL
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == mcl._SCHEMA_VERSION
+        
         conn.close()
     
     @patch('uuid.uuid4')
@@ -125,6 +171,17 @@ class TestManagerDaemon:
         assert row[5] == 200  # budget
         conn.close()
     
+    def test_spawn_agent_rolls_back_on_failure(self):
+        """Test that a failed spawn leaves neither the agent nor its log."""
+        daemon = mcl.ManagerDaemon(self.manager_dir)
+        
+        with patch('mcl.json.dumps', side_effect=TypeError("not serializable")):
+            with pytest.raises(TypeError):
+                daemon.spawn_agent("Test task", "/test/repo")
+        
+        assert daemon.get_active_agents() == []
+        assert daemon.get_agent_logs() == []
+    
     def test_get_active_agents_empty(self):
         """Test getting active agents when none exist."""
         daemon = mcl.ManagerDaemon(self.manager_dir)
@@ -232,11 +289,11 @@ class TestManagerCommands:
         
         mock_print.assert_called_with("⚠️  Manager daemon already running")
     
-    @patch('mcl.is_manager_running', return_value=False)
+    @patch('mcl.is_manager_running')
     @patch('mcl.get_manager_daemon')
     @patch('builtins.print')
-    def test_cmd_manager_add_auto_start(self, mock_print, mock_get_daemon, mock_is_running):
-        """Test manager add command with auto-start."""
+    def test_cmd_manager_add(self, mock_print, mock_get_daemon, mock_is_running):
+        """Test manager add command queues a task without probing the socket."""
         mock_daemon = Mock()
         mock_daemon.spawn_agent.return_value = ("test_agent_id", "test_session_id")
         mock_get_daemon.return_value = mock_daemon
@@ -249,7 +306,7 @@ class TestManagerCommands:
         
         mcl.cmd_manager(args)
         
-        mock_print.assert_any_call("🚀 Starting manager daemon...")
+        mock_is_running.assert_not_called()
         mock_daemon.spawn_agent.assert_called_once_with("Fix bug", "/test/repo", "normal")
         mock_print.assert_any_call("🤖 Task queued with agent test_agent_id")
     
@@ -306,16 +363,18 @@ class TestManagerCommands:
         
         mock_print.assert_called_with("📭 No pending approvals")
     
-    @patch('mcl.is_manager_running', return_value=False)
+    @patch('socket.socket')
     @patch('builtins.print')
-    def test_cmd_manager_stop_not_running(self, mock_print, mock_is_running):
+    def test_cmd_manager_stop_not_running(self, mock_print, mock_socket):
         """Test manager stop command when not running."""
+        mock_socket.return_value.connect.side_effect = FileNotFoundError()
         args = Mock()
         args.manager_command = "stop"
         
         mcl.cmd_manager(args)
         
-        mock_print.assert_called_with("ℹ️  Manager daemon not running")
+        mock_socket.assert_called_once()  # no separate liveness probe
+        mock_print.assert_called_with("❌ Manager daemon not running. Start with: mcl manager start")
     
     @patch('builtins.print')
     def test_cmd_manager_unknown_command(self, mock_print):
@@ -386,6 +445,21 @@ class TestManagerUtilities:
         assert result is False
         mock_print.assert_called_with("❌ Manager daemon not running. Start with: mcl manager start")
     
+    @patch('socket.socket')
+    @patch('builtins.print')
+    def test_send_manager_command_connect_refused(self, mock_print, mock_socket):
+        """Test that a refused connection reports the daemon as not running."""
+        mock_sock = Mock()
+        mock_socket.return_value = mock_sock
+        mock_sock.connect.side_effect = ConnectionRefusedError()
+        
+        result = mcl.send_manager_command("test_command")
+        
+        assert result is False
+        mock_socket.assert_called_once()  # no separate liveness probe
+        mock_sock.close.assert_called_once()
+        mock_print.assert_called_with("❌ Manager daemon not running. Start with: mcl manager start")
+    
     @patch('mcl.is_manager_running', return_value=True)
     @patch('socket.socket')
     @patch('builtins.print')